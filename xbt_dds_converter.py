@@ -1,153 +1,423 @@
 import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
+from tkinter import filedialog, messagebox, ttk, font as tkfont
 import os
+import sys
 import struct
+import base64
 import xml.etree.ElementTree as ET
-import xml.dom.minidom as minidom
 from PIL import Image, ImageTk
 import logging
-import io
+import functools
 import tempfile
 import shutil
 import subprocess
-import numpy as np
-import webbrowser
+import time
+import threading
+import queue
+import collections
+import contextlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-class XBTDDSConverter:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("XBT ↔ DDS Converter | Made By: Jasper_Zebra | Version 1.0")
-        self.root.geometry("1600x1000")
-        self.root.resizable(False, False)
-        self.root.configure(bg='#2c2c2c')
-        
-        # Initialize variables
-        self.conversion_mode = tk.StringVar(value="single")
-        self.conversion_type = tk.StringVar(value="auto")
-        self.file_path = tk.StringVar()
-        self.include_subdirs = tk.BooleanVar(value=True)
-        self.overwrite_existing = tk.BooleanVar(value=False)
-        self.fix_dds_format = tk.BooleanVar(value=False)  # ADD THIS LINE
-        self.background_image = None
-        self.temp_files = []  # Track temporary files for cleanup
-        self.window_icon = None  # Add this to store icon reference
-        
-        # Set up logging
-        logging.basicConfig(level=logging.DEBUG)
-        self.logger = logging.getLogger('XBTDDSConverter')
-        
-        # Set up window icon
-        self._setup_window_icon()
+# DDS header layout: magic + size/flags/height/width/pitch/depth/mipmap count,
+# 44 reserved bytes, then the pixel format at offset 76: size/flags/fourcc/rgb bit count
+_DDS_HDR = struct.Struct('<4s7I44xII4sI')
+# Single little-endian u32 field
+_U32 = struct.Struct('<I')
+# Fixed XBT header start: signature, unknown u32, header size, unknown u32
+_XBT_HEAD = struct.Struct('<4sIII')
 
-        # Setup the modern interface
-        self._setup_background_image()
-        self.setup_modern_ui()
-        
-        # Bind file path changes to preview updates
-        self.file_path.trace('w', self.update_preview)       
+# Display names of DDS FourCC codes, filled in as new codes are seen
+_FOURCC = {code: code.decode('ascii') for code in (
+    b'DXT1', b'DXT2', b'DXT3', b'DXT4', b'DXT5', b'DX10',
+    b'ATI1', b'ATI2', b'BC4U', b'BC4S', b'BC5U', b'BC5S'
+)}
 
-    def _setup_window_icon(self):
-        """Set up the window icon"""
+def _fourcc_name(pf_fourcc):
+    """Return the display name of a DDS FourCC code"""
+    name = _FOURCC.get(pf_fourcc)
+    if name is None:
+        if pf_fourcc.isascii():
+            name = pf_fourcc.decode('ascii').strip('\x00')
+        else:
+            name = f"FourCC: {pf_fourcc.hex().upper()}"
+        _FOURCC[pf_fourcc] = name
+    return name
+
+# File type by the first 4 bytes, see detect_file_type
+_FILE_TYPES = {b'TBX\x00': 'xbt', b'DDS ': 'dds'}
+# Size of a bare DDS header - smaller files can't hold a texture in either format
+_MIN_INPUT_BYTES = 128
+
+# The DDS signature normally sits within the first few hundred bytes of an XBT
+_XBT_PREFIX_SIZE = 4096
+# Furthest offset searched for the DDS signature - past this the file is not treated as XBT
+_XBT_HEADER_LIMIT = 64 * 1024
+
+# Read once at import (umask can only be read by setting it) - temp outputs get the
+# permissions a plain open() would have given them, not mkstemp's owner-only 0o600
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def _read_xbt_prefix(f):
+    """Read the start of an XBT file up to and including the DDS signature"""
+    data = f.read(_XBT_PREFIX_SIZE)
+    if b'DDS ' not in data:
+        # Unusually large header - read on, but never past _XBT_HEADER_LIMIT
+        data += f.read(_XBT_HEADER_LIMIT - len(data))
+    return data
+
+def _bopen(path, mode):
+    """Open a file with a 1 MiB buffer, hinting sequential access to the OS"""
+    def opener(file, flags):
+        # O_SEQUENTIAL maps to FILE_FLAG_SEQUENTIAL_SCAN on Windows
+        fd = os.open(file, flags | getattr(os, 'O_SEQUENTIAL', 0), 0o666)
+        if 'r' in mode and hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        return fd
+    return open(path, mode, buffering=1 << 20, opener=opener)
+
+@contextlib.contextmanager
+def _replace_on_success(path, overwrite=True):
+    """Write path through a temp file next to it, moved into place only if the block succeeds.
+    
+    With overwrite=False path is first claimed with an exclusive create, raising
+    FileExistsError if it already exists. On failure nothing this call created is left behind.
+    """
+    created = []  # Files to remove on failure - never one that was there before this call
+    try:
+        if not overwrite:
+            os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666))
+            created.append(path)
+        # A unique name, so a temp left over by a crashed run can't collide with this one
+        fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp',
+                                         dir=os.path.dirname(path) or '.')
+        created.append(temp_path)
+        if hasattr(os, 'fchmod'):
+            os.fchmod(fd, 0o666 & ~_UMASK)
+        with open(fd, 'wb', buffering=1 << 20) as f:
+            yield f
+        os.replace(temp_path, path)
+    except BaseException:
+        for leftover in created:
+            try:
+                os.unlink(leftover)
+            except OSError:
+                pass
+        raise
+
+def _preallocate(f, size):
+    """Reserve space for a file about to be written front to back"""
+    try:
+        if hasattr(os, 'posix_fallocate'):
+            os.posix_fallocate(f.fileno(), 0, size)
+        else:
+            f.truncate(size)  # SetEndOfFile on Windows
+    except OSError:
+        pass  # Only an optimization, e.g. the filesystem doesn't support it
+
+def _fast_copy(src, dst, overwrite=True):
+    """Copy a file and its timestamps and mode like shutil.copy2, through the OS copy path where available.
+    
+    CopyFileW on Windows (which copies the metadata itself), copy_file_range on
+    Linux, otherwise (or if those fail) a buffered shutil.copyfileobj stream followed
+    by shutil.copystat. With overwrite=False the destination is created exclusively
+    and FileExistsError is raised if it is already there - no separate exists check.
+    """
+    if sys.platform == 'win32':
+        import ctypes
+        if ctypes.windll.kernel32.CopyFileW(src, dst, not overwrite):
+            return
+        if not overwrite and os.path.exists(dst):  # Only stat on the failure path
+            raise FileExistsError(f"File exists: {dst}")
+    
+    # Not shutil.copyfile, the 'xb' mode is what makes the create exclusive
+    with _bopen(src, 'rb') as fsrc, _bopen(dst, 'wb' if overwrite else 'xb') as fdst:
+        copied_natively = False
+        if hasattr(os, 'copy_file_range'):
+            try:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                copied_natively = True
+            except OSError:
+                # Not supported here (old kernel, cross-device, ...) - start over below
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+        
+        if not copied_natively:
+            shutil.copyfileobj(fsrc, fdst, length=1 << 20)
+    
+    # After closing, so the final write doesn't bump the copied mtime
+    shutil.copystat(src, dst)
+
+def _pattern_image(data, offset, pattern_size, fill):
+    """Build a square RGB pattern from raw bytes at offset - whole triples only, padded with fill"""
+    import numpy as np
+    
+    n = pattern_size * pattern_size * 3
+    usable = max(0, min(len(data) - offset, n)) // 3 * 3
+    buf = np.frombuffer(data, dtype=np.uint8, count=usable, offset=offset)
+    if usable < n:
+        buf = np.pad(buf, (0, n - usable), constant_values=fill)
+    # Pillow keeps RGB as 4 bytes per pixel, so this decodes into a new image - the numpy
+    # slice only saves making an intermediate bytes copy of data first
+    return Image.frombuffer('RGB', (pattern_size, pattern_size), buf, 'raw', 'RGB', 0, 1)
+
+def _header_has_mipmaps(dds_data):
+    """Check the DDS header at the start of dds_data for a mip chain"""
+    if len(dds_data) < 32:
+        return False
+    flags = _U32.unpack_from(dds_data, 8)[0]
+    mip_count = _U32.unpack_from(dds_data, 28)[0]
+    return bool(flags & 0x20000) and mip_count > 1
+
+# Marks a lazily computed value that has not been looked up yet
+_UNSET = object()
+
+# Worker threads for batch file work
+_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+# Interval for writing queued messages to the log widget - ~5 redraws per second
+_LOG_FLUSH_MS = 200
+
+# Number of recently shown files whose preview is kept in memory
+_PREVIEW_CACHE_SIZE = 32
+
+# Number of decoded header XML files kept in memory for repeated DDS to XBT runs
+_HEADER_CACHE_SIZE = 64
+
+# Number of detected file types remembered, enough for a few large batch folders
+_TYPE_CACHE_SIZE = 4096
+
+# Preview canvas is square; image placement and overlay positions derive from this
+_PREVIEW_CANVAS_SIZE = 450
+
+# Candidate window icons, in order of preference
+_ICON_PATHS = (
+    os.path.join("assets", "converter_icon.png"),
+    os.path.join("assets", "converter_icon.ico"),
+    os.path.join("Background", "converter_background.png"),
+    "converter_icon.png",
+    "converter_icon.ico"
+)
+
+@functools.lru_cache(maxsize=1)
+def _existing_icon_paths():
+    """Return the icon candidates that exist - searched once per process"""
+    return tuple(path for path in _ICON_PATHS if os.path.exists(path))
+
+@functools.lru_cache(maxsize=None)
+def _load_icon_image(icon_path):
+    """Load an icon image resized to 32x32 - decoded once per process"""
+    icon_image = Image.open(icon_path)
+    return icon_image.resize((32, 32), Image.Resampling.BILINEAR)
+
+@functools.lru_cache(maxsize=1)
+def _load_background(size):
+    """Load the window background at the given size - decoded once per process"""
+    # Prefer the asset shipped at window size, so no resize is needed at all
+    presized_path = os.path.join("assets", f"converter_background_{size[0]}x{size[1]}.png")
+    if os.path.exists(presized_path):
+        bg_image = Image.open(presized_path)
+        bg_image.load()
+        return bg_image
+    
+    bg_image_path = os.path.join("Background", "converter_background.png")
+    if os.path.exists(bg_image_path):
+        return Image.open(bg_image_path).resize(size, Image.Resampling.BILINEAR)
+    return None
+
+def _iter_files(root, exts, on_dir=None, recursive=True):
+    """Yield (path, lower-cased name) of files below root ending with one of exts.
+    
+    exts must be a tuple of lower-case extensions, see _ext_tuple.
+    With recursive=False only root itself is listed.
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        if on_dir:
+            on_dir(current)
         try:
-            # Try different possible icon locations
-            icon_paths = [
-                os.path.join("assets", "converter_icon.png"),
-                os.path.join("assets", "converter_icon.ico"),
-                os.path.join("Background", "converter_background.png"),
-                "converter_icon.png",
-                "converter_icon.ico"
-            ]
-            
-            icon_set = False
-            
-            for icon_path in icon_paths:
-                if os.path.exists(icon_path):
-                    try:
-                        if icon_path.lower().endswith('.ico'):
-                            # Use ICO file directly
-                            self.root.iconbitmap(icon_path)
-                            self.logger.debug(f"Set ICO icon: {icon_path}")
-                            icon_set = True
-                            break
-                        elif icon_path.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp')):
-                            # Convert image to PhotoImage and use as icon
-                            icon_image = Image.open(icon_path)
-                            # Resize to appropriate icon size
-                            icon_image = icon_image.resize((32, 32), Image.Resampling.LANCZOS)
-                            icon_photo = ImageTk.PhotoImage(icon_image)
-                            
-                            # Set the icon
-                            self.root.iconphoto(True, icon_photo)
-                            
-                            # Keep a reference to prevent garbage collection
-                            self.window_icon = icon_photo
-                            
-                            self.logger.debug(f"Set PNG icon: {icon_path}")
-                            icon_set = True
-                            break
-                            
-                    except Exception as e:
-                        self.logger.warning(f"Failed to load icon {icon_path}: {str(e)}")
-                        continue
-            
-            if not icon_set:
-                self.logger.info("No icon file found, using default system icon")
-                
-            return icon_set
-            
-        except Exception as e:
-            self.logger.error(f"Error setting up window icon: {str(e)}")
-            return False
+            with os.scandir(current) as it:
+                for entry in it:
+                    # DirEntry caches the type from the directory listing - no extra stat
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    else:
+                        lower_name = entry.name.lower()
+                        if lower_name.endswith(exts) and entry.is_file():
+                            yield entry.path, lower_name
+        except OSError:
+            continue  # Unreadable directory, os.walk skipped these as well
 
-    def _setup_background_image(self):
-        """Load and set up the background image"""
+def _split_by_name(paths):
+    """Split paths into lists with no file name repeated (case-insensitive), keeping their order"""
+    batches = []
+    seen = collections.Counter()
+    for path in paths:
+        name = os.path.basename(path).lower()
+        index = seen[name]
+        seen[name] += 1
+        if index == len(batches):
+            batches.append([])
+        batches[index].append(path)
+    return batches
+
+def _ext_tuple(extensions):
+    """Lower-case extensions once, as a tuple for str.endswith"""
+    return tuple(ext.lower() for ext in extensions)
+
+def _scan_files(root, exts, on_dir=None, recursive=True):
+    """Collect matching files below root in one pass - returns (sorted paths, XBT count, DDS count).
+    
+    on_dir(current_dir, xbt_count, dds_count) is called as each directory is entered.
+    """
+    files = []
+    xbt_count = 0
+    dds_count = 0
+    # With a single extension every match has the same type - the list length is the count
+    single = exts[0] if len(exts) == 1 else None
+    
+    def enter(current_dir):
+        if single == '.xbt':
+            on_dir(current_dir, len(files), 0)
+        elif single == '.dds':
+            on_dir(current_dir, 0, len(files))
+        else:
+            on_dir(current_dir, xbt_count, dds_count)
+    
+    walk = _iter_files(root, exts, enter if on_dir else None, recursive)
+    if single:
+        for filepath, _ in walk:
+            files.append(filepath)
+        if single == '.xbt':
+            xbt_count = len(files)
+        elif single == '.dds':
+            dds_count = len(files)
+    else:
+        for filepath, lower_name in walk:
+            files.append(filepath)
+            if lower_name.endswith('.xbt'):
+                xbt_count += 1
+            elif lower_name.endswith('.dds'):
+                dds_count += 1
+    files.sort()
+    return files, xbt_count, dds_count
+
+def _ui_thread(method):
+    """Decorator for Tk methods that the conversion worker calls.
+    
+    Tk may only be used from the main thread - from any other thread the call is
+    queued and run later by _run_ui_calls, and returns None.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if threading.current_thread() is threading.main_thread():
+            return method(self, *args, **kwargs)
+        self._ui_calls.put((method, args, kwargs))
+    return wrapper
+
+class XBTDDSEngine:
+    """XBT/DDS conversion without any UI - usable from scripts.
+    
+    Progress hooks and _write_log are overridden by the Tk front end.
+    """
+    def __init__(self):
+        self.temp_files = []  # Track temporary files for cleanup
+        self._texconv_path = _UNSET  # Result of find_texconv, looked up on first use
+        # Shared by batch conversions and texconv fixing, its threads are reused between batches
+        self._pool = ThreadPoolExecutor(max_workers=_MAX_WORKERS)
+        self._header_cache = collections.OrderedDict()  # (xml path, mtime, size) -> header bytes
+        self._header_cache_lock = threading.Lock()  # Batch workers share the cache
+        self._type_cache = collections.OrderedDict()  # (path, mtime, size) -> detect_file_type result
+        self._type_cache_lock = threading.Lock()
+        self.logger = logging.getLogger('XBTDDSConverter')
+        self._log_block = threading.local()  # .lines collects a worker's messages inside _buffered_log
+        
+    def log_message(self, message):
+        """Report a progress or result message - held back while this thread is in _buffered_log"""
+        lines = getattr(self._log_block, 'lines', None)
+        if lines is not None:
+            lines.append(message)
+        else:
+            self._write_log(message)
+            
+    def _write_log(self, message):
+        """Output a log message, which may span several lines"""
+        self.logger.info(message)
+        
+    @contextlib.contextmanager
+    def _buffered_log(self):
+        """Collect this thread's log messages and write them as one block on exit.
+        
+        Keeps the lines of files converted in parallel from interleaving. Nested use
+        just joins the outer block.
+        """
+        if getattr(self._log_block, 'lines', None) is not None:
+            yield
+            return
+        self._log_block.lines = lines = []
         try:
-            # You can use the same background or create a similar one
-            bg_image_path = os.path.join("Background", "converter_background.png")
-            
-            if os.path.exists(bg_image_path):
-                pil_image = Image.open(bg_image_path)
-                pil_image = pil_image.resize((1600, 1000), Image.Resampling.LANCZOS)
-                self.background_image = ImageTk.PhotoImage(pil_image)
-                
-                self.canvas = tk.Canvas(self.root, width=1400, height=900, highlightthickness=0)
-                self.canvas.pack(fill=tk.BOTH, expand=True)
-                self.canvas.create_image(0, 0, anchor=tk.NW, image=self.background_image)
-                
-                self.logger.debug(f"Background image loaded successfully")
-                return True
-            else:
-                self.logger.warning(f"Background image not found, using solid background")
-                self.canvas = tk.Canvas(self.root, width=1400, height=900, bg='#2c2c2c', highlightthickness=0)
-                self.canvas.pack(fill=tk.BOTH, expand=True)
-                return False
-                
-        except Exception as e:
-            self.logger.error(f"Failed to load background image: {str(e)}")
-            self.canvas = tk.Canvas(self.root, width=1400, height=900, bg='#2c2c2c', highlightthickness=0)
-            self.canvas.pack(fill=tk.BOTH, expand=True)
-            return False
+            yield
+        finally:
+            self._log_block.lines = None
+            if lines:
+                self._write_log("\n".join(lines))
+        
+    # Progress hooks - no-ops without a UI
+    def show_copy_progress_window(self, total_files):
+        pass
+    
+    def update_copy_progress(self, current_file, completed, total):
+        pass
+    
+    def close_copy_progress_window(self):
+        pass
+    
+    def show_convert_progress_window(self, total_files):
+        pass
+    
+    def update_convert_progress(self, current_file, completed, total):
+        pass
+    
+    def close_convert_progress_window(self):
+        pass
+    
+    def find_files_in_folder_with_progress(self, folder_path, extensions, recursive=True):
+        """Find all files with given extensions in folder (no progress display here).
+        
+        Returns (sorted files, XBT count, DDS count).
+        """
+        return _scan_files(folder_path, _ext_tuple(extensions), recursive=recursive)
 
     def extract_dds_data(self, filepath):
-        """Extract DDS data from XBT or DDS file"""
+        """Extract DDS data from XBT or DDS file - returns (bytes, error)"""
         try:
             with open(filepath, 'rb') as f:
-                data = f.read()
-            
-            # Check if it's an XBT file
-            if data[:4] == b'TBX\x00':
-                # Find DDS signature in XBT file
-                dds_start = data.find(b'DDS ')
-                if dds_start == -1:
-                    return None, "No DDS data found in XBT file"
-                return data[dds_start:], None
-            
-            # Check if it's a DDS file
-            elif data[:4] == b'DDS ':
-                return data, None
-            
-            else:
-                return None, "File is neither XBT nor DDS format"
+                prefix = _read_xbt_prefix(f)
+                magic = prefix[:4]
+                
+                # Check if it's an XBT file
+                if magic == b'TBX\x00':
+                    # Find DDS signature in XBT file, only the data from there on is read
+                    dds_start = prefix.find(b'DDS ')
+                    if dds_start == -1:
+                        return None, "No DDS data found in XBT file"
+                    f.seek(dds_start)
+                    return f.read(), None
+                
+                # Check if it's a DDS file
+                elif magic == b'DDS ':
+                    return prefix + f.read(), None
+                
+                else:
+                    return None, "File is neither XBT nor DDS format"
                 
         except Exception as e:
             return None, f"Error reading file: {str(e)}"
@@ -158,34 +428,17 @@ class XBTDDSConverter:
             if len(dds_data) < 128:  # DDS header is 128 bytes minimum
                 return None, "DDS data too small"
             
-            # DDS header structure (simplified)
-            magic = dds_data[:4]  # Should be b'DDS '
+            # DDS header structure and pixel format (simplified), unpacked in one call
+            (magic, size, flags, height, width, pitch_or_linear_size, depth, mipmap_count,
+             pf_size, pf_flags, pf_fourcc, rgb_bit_count) = _DDS_HDR.unpack_from(dds_data, 0)
             if magic != b'DDS ':
                 return None, "Invalid DDS magic signature"
             
-            # Read basic header info
-            size = struct.unpack('<I', dds_data[4:8])[0]  # Should be 124
-            flags = struct.unpack('<I', dds_data[8:12])[0]
-            height = struct.unpack('<I', dds_data[12:16])[0]
-            width = struct.unpack('<I', dds_data[16:20])[0]
-            pitch_or_linear_size = struct.unpack('<I', dds_data[20:24])[0]
-            depth = struct.unpack('<I', dds_data[24:28])[0]
-            mipmap_count = struct.unpack('<I', dds_data[28:32])[0]
-            
-            # Skip reserved fields and get pixel format
-            pf_size = struct.unpack('<I', dds_data[76:80])[0]
-            pf_flags = struct.unpack('<I', dds_data[80:84])[0]
-            pf_fourcc = dds_data[84:88]
-            
             # Determine format
             format_name = "Unknown"
             if pf_flags & 0x4:  # DDPF_FOURCC
-                try:
-                    format_name = pf_fourcc.decode('ascii').strip('\x00')
-                except:
-                    format_name = f"FourCC: {pf_fourcc.hex().upper()}"
+                format_name = _fourcc_name(pf_fourcc)
             elif pf_flags & 0x40:  # DDPF_RGB
-                rgb_bit_count = struct.unpack('<I', dds_data[88:92])[0]
                 format_name = f"RGB {rgb_bit_count}-bit"
             
             info = {
@@ -201,65 +454,12 @@ class XBTDDSConverter:
         except Exception as e:
             return None, f"Error parsing DDS header: {str(e)}"
 
-    def create_preview_image(self, dds_data, max_size=360):
-        """Create a preview image from DDS data"""
-        try:
-            # For now, we'll create a placeholder that shows the texture exists
-            # and basic info. Full DDS decoding would require more complex logic
-            # or external libraries like DirectXTex
-            
-            info, error = self.parse_dds_header(dds_data)
-            if error:
-                return None, error
-            
-            # Create a placeholder image with texture info
-            preview_img = Image.new('RGB', (max_size, max_size), color='#404040')
-            
-            # Try to extract some pixel data for a simple preview
-            # This is a very basic approach - real DDS decoding is much more complex
-            try:
-                # Skip DDS header (128 bytes) and try to interpret raw pixel data
-                pixel_data_start = 128
-                if len(dds_data) > pixel_data_start + 1024:  # Ensure we have some data
-                    # Create a simple pattern from the raw data
-                    raw_pixels = dds_data[pixel_data_start:pixel_data_start + min(max_size * max_size * 3, len(dds_data) - pixel_data_start)]
-                    
-                    # Create a simple visualization
-                    if len(raw_pixels) > 0:
-                        # Scale the raw data to create a pattern
-                        pattern_size = min(64, int(len(raw_pixels) ** 0.5))
-                        if pattern_size > 0:
-                            pattern_img = Image.new('RGB', (pattern_size, pattern_size))
-                            pixels = []
-                            
-                            for i in range(0, min(len(raw_pixels), pattern_size * pattern_size * 3), 3):
-                                if i + 2 < len(raw_pixels):
-                                    r = raw_pixels[i] if i < len(raw_pixels) else 0
-                                    g = raw_pixels[i + 1] if i + 1 < len(raw_pixels) else 0
-                                    b = raw_pixels[i + 2] if i + 2 < len(raw_pixels) else 0
-                                    pixels.append((r, g, b))
-                                else:
-                                    pixels.append((100, 100, 100))
-                            
-                            # Fill remaining pixels if needed
-                            while len(pixels) < pattern_size * pattern_size:
-                                pixels.append((100, 100, 100))
-                            
-                            pattern_img.putdata(pixels[:pattern_size * pattern_size])
-                            
-                            # Scale up the pattern to preview size
-                            preview_img = pattern_img.resize((max_size, max_size), Image.NEAREST)
-            except:
-                # If pixel extraction fails, create a info display
-                pass
-            
-            return preview_img, None
-            
-        except Exception as e:
-            return None, f"Error creating preview: {str(e)}"
-
-    def convert_batch(self, folder_path):
-        """Convert all XBT/DDS files in a folder with two-step process"""
+    def convert_batch(self, folder_path, conversion_type="auto", overwrite=False,
+                      fix_format=False, archive_originals=False, include_subdirs=True):
+        """Convert all XBT/DDS files in a folder, optionally archiving the XBT originals first.
+        
+        Subfolders are searched too unless include_subdirs is False.
+        """
         try:
             # Get converter's root directory (where the script is located)
             converter_root = os.path.dirname(os.path.abspath(__file__))
@@ -268,8 +468,6 @@ class XBTDDSConverter:
             self.log_message("🔍 Step 1: Scanning for files...")
             
             # Determine which files to process
-            conversion_type = self.conversion_type.get()
-            
             if conversion_type == "auto":
                 # Find both XBT and DDS files
                 extensions = ['.xbt', '.dds']
@@ -278,15 +476,22 @@ class XBTDDSConverter:
             else:  # dds_to_xbt
                 extensions = ['.dds']
                 
-            files = self.find_files_in_folder_with_progress(folder_path, extensions)
+            files, _, _ = self.find_files_in_folder_with_progress(folder_path, extensions,
+                                                                  recursive=include_subdirs)
             
             if not files:
                 self.log_message(f"❌ No files found with extensions: {', '.join(extensions)}")
                 return False
             
-            # Count files by type
-            xbt_files = [f for f in files if f.lower().endswith('.xbt')]
-            dds_files = [f for f in files if f.lower().endswith('.dds')]
+            # Split files by type in a single pass
+            xbt_files = []
+            dds_files = []
+            for f in files:
+                lower_name = f.lower()
+                if lower_name.endswith('.xbt'):
+                    xbt_files.append(f)
+                elif lower_name.endswith('.dds'):
+                    dds_files.append(f)
             
             self.log_message(f"📊 Found {len(files)} total file(s):")
             self.log_message(f"   📦 XBT files: {len(xbt_files)}")
@@ -296,9 +501,11 @@ class XBTDDSConverter:
             extract_dir = os.path.join(converter_root, "extracted_xbt_files")
             convert_dir = os.path.join(converter_root, "converted_dds_files")
             
-            # Step 2: Extract/Copy XBT files
-            if xbt_files:
-                self.log_message(f"\n🔍 Step 2: Extracting {len(xbt_files)} XBT files...")
+            # Step 2 (optional): Archive copies of the XBT files - conversion reads the originals
+            step = 2
+            if xbt_files and archive_originals:
+                self.log_message(f"\n🔍 Step {step}: Archiving {len(xbt_files)} XBT files...")
+                step += 1
                 
                 if not os.path.exists(extract_dir):
                     os.makedirs(extract_dir)
@@ -318,22 +525,21 @@ class XBTDDSConverter:
                         # Update copy progress
                         self.update_copy_progress(xbt_file, i, len(xbt_files))
                         
-                        if not os.path.exists(dest_path) or self.overwrite_existing.get():
-                            shutil.copy2(xbt_file, dest_path)
-                            rel_path = os.path.relpath(xbt_file, folder_path)
-                            self.log_message(f"   📋 Copied: {rel_path}")
-                        else:
-                            self.log_message(f"   ⚠️ Skipped existing: {filename}")
+                        _fast_copy(xbt_file, dest_path, overwrite=overwrite)
+                        rel_path = os.path.relpath(xbt_file, folder_path)
+                        self.log_message(f"   📋 Copied: {rel_path}")
                             
+                    except FileExistsError:
+                        self.log_message(f"   ⚠️ Skipped existing: {filename}")
                     except Exception as e:
                         self.log_message(f"   ❌ Error copying {os.path.basename(xbt_file)}: {str(e)}")
                 
                 # Final copy progress update
                 self.update_copy_progress("Copy Complete!", len(xbt_files), len(xbt_files))
-                self.root.after(300, self.close_copy_progress_window)
+                self.close_copy_progress_window()
             
-            # Step 3: Convert files
-            self.log_message(f"\n🔄 Step 3: Converting files...")
+            # Convert files
+            self.log_message(f"\n🔄 Step {step}: Converting files...")
             
             if not os.path.exists(convert_dir):
                 os.makedirs(convert_dir)
@@ -344,17 +550,16 @@ class XBTDDSConverter:
             # Prepare files for conversion
             files_to_convert = []
             
-            # Add extracted XBT files if we're doing XBT to DDS conversion
+            # Add XBT files if we're doing XBT to DDS conversion
             if conversion_type in ["auto", "xbt_to_dds"] and xbt_files:
-                extracted_xbt_files = [os.path.join(extract_dir, os.path.basename(f)) for f in xbt_files]
-                files_to_convert.extend(extracted_xbt_files)
+                files_to_convert.extend(xbt_files)
             
             # Add DDS files if we're doing DDS to XBT conversion
             if conversion_type in ["auto", "dds_to_xbt"] and dds_files:
                 files_to_convert.extend(dds_files)
             
             if not files_to_convert:
-                self.log_message("❌ No files to convert after extraction")
+                self.log_message("❌ No files to convert")
                 return False
             
             # Show convert progress window
@@ -363,15 +568,28 @@ class XBTDDSConverter:
             converted = 0
             skipped = 0
             errors = 0
+            completed = 0
             
-            for i, input_path in enumerate(files_to_convert):
+            # Plan conversions here, the actual file work runs in the worker pool
+            jobs = []
+            planned_outputs = set()
+            
+            for input_path in files_to_convert:
                 try:
                     # Update convert progress
-                    self.update_convert_progress(input_path, i, len(files_to_convert))
+                    self.update_convert_progress(input_path, completed, len(files_to_convert))
+                    
+                    # One stat per file covers the size check and the file type lookup
+                    st = os.stat(input_path)
+                    if st.st_size < _MIN_INPUT_BYTES:
+                        self.log_message(f"⚠️ Skipping {os.path.basename(input_path)}: file too small ({st.st_size} bytes)")
+                        skipped += 1
+                        completed += 1
+                        continue
                     
                     # Determine conversion for this file
                     if conversion_type == "auto":
-                        file_type = self.detect_file_type(input_path)
+                        file_type = self.detect_file_type(input_path, st)
                         if file_type == 'xbt':
                             current_conversion = "xbt_to_dds"
                         elif file_type == 'dds':
@@ -379,6 +597,7 @@ class XBTDDSConverter:
                         else:
                             self.log_message(f"⚠️ Skipping unknown file type: {os.path.basename(input_path)}")
                             skipped += 1
+                            completed += 1
                             continue
                     else:
                         current_conversion = conversion_type
@@ -388,11 +607,13 @@ class XBTDDSConverter:
                     if not can_convert:
                         self.log_message(f"⚠️ Skipping {os.path.basename(input_path)}: {error_msg}")
                         skipped += 1
+                        completed += 1
                         continue
 
                     # Generate output path in the converted_dds_files directory
                     input_filename = os.path.basename(input_path)
                     base_name = os.path.splitext(input_filename)[0]
+                    xml_output_path = None
                     
                     if current_conversion == "xbt_to_dds":
                         output_filename = base_name + ".dds"
@@ -403,32 +624,68 @@ class XBTDDSConverter:
                         output_filename = base_name + ".xbt"
                         output_path = os.path.join(convert_dir, output_filename)
                         
-                    # Check if output already exists
-                    if os.path.exists(output_path) and not self.overwrite_existing.get():
+                    # Two inputs with the same name would race on one output file - matched
+                    # like the file system does, Foo.xbt and foo.xbt collide on Windows
+                    output_key = os.path.normcase(os.path.abspath(output_path))
+                    if output_key in planned_outputs:
+                        self.log_message(f"⚠️ Skipping duplicate output name: {output_filename}")
+                        skipped += 1
+                        completed += 1
+                        continue
+                        
+                    # Drop existing outputs now, before any texconv work is spent on them -
+                    # the worker's exclusive create still catches files that appear meanwhile
+                    if not overwrite and os.path.exists(output_path):
                         self.log_message(f"⚠️ Skipping existing file: {output_filename}")
                         skipped += 1
+                        completed += 1
                         continue
                         
-                    self.log_message(f"🔄 Converting: {input_filename} → {output_filename}")
-                    
-                    # Perform conversion
-                    if current_conversion == "xbt_to_dds":
-                        success = self.xbt_to_dds_batch(input_path, output_path, xml_output_path)
-                    else:
-                        success = self.dds_to_xbt(input_path, output_path)
+                    planned_outputs.add(output_key)
+                    jobs.append((input_path, current_conversion, output_path, xml_output_path))
                         
-                    if success:
+                except Exception as e:
+                    self.log_message(f"❌ Error processing {os.path.basename(input_path)}: {str(e)}")
+                    errors += 1
+                    completed += 1
+            
+            # Fix DDS formats up front, with one texconv run per group of files instead of one per file
+            fixed_paths = {}
+            if fix_format:
+                dds_inputs = [job[0] for job in jobs if job[1] == "dds_to_xbt"]
+                texconv_path = self._get_texconv() if dds_inputs else None
+                if texconv_path:
+                    self.log_message(f"🔧 Fixing {len(dds_inputs)} DDS file(s) with texconv: {texconv_path}")
+                    self.update_convert_progress("Fixing DDS formats...", completed, len(files_to_convert))
+                    fixed_paths = self.fix_dds_formats_with_texconv(dds_inputs, texconv_path)
+            
+            # Perform conversions on the shared worker pool
+            futures = {
+                self._pool.submit(self._convert_one, *job, overwrite=overwrite, fix_format=fix_format,
+                                  fixed_dds_path=fixed_paths.get(job[0])): job[0]
+                for job in jobs
+            }
+            
+            for future in as_completed(futures):
+                input_path = futures[future]
+                try:
+                    result = future.result()
+                    if result is None:
+                        skipped += 1
+                    elif result:
                         converted += 1
                     else:
                         errors += 1
-                        
                 except Exception as e:
                     self.log_message(f"❌ Error processing {os.path.basename(input_path)}: {str(e)}")
                     errors += 1
-                    
+                
+                completed += 1
+                self.update_convert_progress(input_path, completed, len(files_to_convert))
+                
             # Final convert progress update
             self.update_convert_progress("Conversion Complete!", len(files_to_convert), len(files_to_convert))
-            self.root.after(300, self.close_convert_progress_window)
+            self.close_convert_progress_window()
             
             # Summary
             self.log_message("="*60)
@@ -438,8 +695,8 @@ class XBTDDSConverter:
             self.log_message(f"   ✅ Successfully converted: {converted}")
             self.log_message(f"   ⚠️ Skipped: {skipped}")
             self.log_message(f"   ❌ Errors: {errors}")
-            if xbt_files:
-                self.log_message(f"   📁 Extracted XBT files: {os.path.relpath(extract_dir, converter_root)}")
+            if xbt_files and archive_originals:
+                self.log_message(f"   📁 Archived XBT files: {os.path.relpath(extract_dir, converter_root)}")
             self.log_message(f"   📁 Converted files: {os.path.relpath(convert_dir, converter_root)}")
             
             return errors == 0
@@ -447,37 +704,749 @@ class XBTDDSConverter:
         except Exception as e:
             self.log_message(f"❌ Batch conversion error: {str(e)}")
             return False
-    
-    def xbt_to_dds_batch(self, input_path, output_path, xml_output_path):
-        """Convert XBT file to DDS for batch processing - modified to handle separate XML path"""
+
+    def _convert_one(self, input_path, conversion, output_path, xml_output_path,
+                     overwrite=False, fix_format=False, fixed_dds_path=None):
+        """Convert a single batch file - runs on a worker thread.
+        
+        Returns True/False for success/failure, or None if the output already existed.
+        """
+        input_filename = os.path.basename(input_path)
+        output_filename = os.path.basename(output_path)
+        
+        # Logged as one block under the "Converting" line, other workers log at the same time
+        with self._buffered_log():
+            self.log_message(f"🔄 Converting: {input_filename} → {output_filename}")
+            
+            try:
+                if conversion == "xbt_to_dds":
+                    return self.xbt_to_dds_batch(input_path, output_path, xml_output_path,
+                                                 overwrite=overwrite)
+                return self.dds_to_xbt(input_path, output_path, fix_format=fix_format,
+                                       overwrite=overwrite, fixed_dds_path=fixed_dds_path)
+            except FileExistsError:
+                self.log_message(f"⚠️ Skipping existing file: {output_filename}")
+                return None
+
+    def xbt_to_dds_batch(self, input_path, output_path, xml_output_path, overwrite=True):
+        """Convert XBT file to DDS for batch processing - modified to handle separate XML path.
+        
+        With overwrite=False raises FileExistsError if the DDS output already exists.
+        """
+        try:
+            with _bopen(input_path, 'rb') as f:
+                header_size, dds_start, header_data = self.parse_xbt_header(_read_xbt_prefix(f))
+                dds_size = os.fstat(f.fileno()).st_size - dds_start
+                f.seek(dds_start)
+                
+                # The DDS only appears under its real name once payload and XML are both written
+                with _replace_on_success(output_path, overwrite) as out:
+                    # Stream DDS data (everything after DDS signature) to output directory
+                    if dds_size > 0:
+                        _preallocate(out, dds_size)
+                    shutil.copyfileobj(f, out, length=1 << 20)
+                    out.truncate()  # In case the input shrank while copying
+                    
+                    # Save header to XML file in output directory
+                    if not self.save_header_to_xml(header_data, xml_output_path):
+                        raise ValueError("Failed to save header to XML")
+                
+            self.log_message(f"✅ Successfully converted XBT to DDS")
+            self.log_message(f"📊 Removed {dds_start} bytes of XBT header")
+            self.log_message(f"📊 DDS file size: {os.path.getsize(output_path)} bytes")
+            self.log_message(f"💾 Header saved as: {os.path.basename(xml_output_path)}")
+            
+            return True
+            
+        except FileExistsError:
+            raise
+        except Exception as e:
+            self.log_message(f"❌ Error converting XBT to DDS: {str(e)}")
+            return False
+
+    def find_files_in_folder(self, folder_path, extensions, recursive=True):
+        """Find all files with given extensions in folder - recursively unless recursive is False"""
+        return sorted(path for path, _ in _iter_files(folder_path, _ext_tuple(extensions), recursive=recursive))
+
+    def cleanup_temp_files(self):
+        """Clean up temporary files - large numbers are deleted on a background thread"""
+        temp_paths, self.temp_files = self.temp_files, []
+        
+        if len(temp_paths) > 32:
+            # Not a daemon thread, so deletion still finishes if the app exits meanwhile
+            threading.Thread(target=self._delete_temp_files, args=(temp_paths,)).start()
+        else:
+            self._delete_temp_files(temp_paths)
+            
+    def _delete_temp_files(self, temp_paths):
+        for temp_path in temp_paths:
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.log_message(f"⚠️ Could not delete temp file: {str(e)}")
+
+    def has_alpha(self, image):
+        """Check if image has meaningful alpha data"""
+        if image.mode != 'RGBA':
+            return False
+        # Smallest alpha value, computed in one pass over the alpha band only
+        return image.getchannel('A').getextrema()[0] < 255
+
+    def has_mipmaps(self, filepath):
+        """Check if DDS file has mipmaps"""
+        try:
+            with open(filepath, 'rb') as f:
+                return _header_has_mipmaps(f.read(32))  # Magic + partial header
+        except:
+            return False
+
+    def find_texconv(self):
+        """Find texconv.exe tool"""
+        # Check current directory first
+        local_texconv = os.path.join(os.path.dirname(__file__), 'texconv.exe')
+        if os.path.exists(local_texconv):
+            return local_texconv
+        
+        # Check PATH
+        try:
+            subprocess.run(['texconv'], capture_output=True, check=False)
+            return 'texconv'
+        except FileNotFoundError:
+            return None
+
+    def _get_texconv(self):
+        """find_texconv, cached - it doesn't change while the app is running"""
+        if self._texconv_path is _UNSET:
+            self._texconv_path = self.find_texconv()
+        return self._texconv_path
+
+    def _texconv_options(self, input_path):
+        """Pick the texconv format and mipmap flags for a DDS file - returns (format, mip levels)"""
+        # Runs in parallel for batches, so the file's lines are logged together
+        with self._buffered_log():
+            self.log_message(f"🔧 Fixing DDS format: {os.path.basename(input_path)}")
+            
+            # One open serves both checks, and the file is never copied into memory whole
+            dds_head = b''
+            try:
+                with open(input_path, 'rb') as f:
+                    dds_head = f.read(32)  # Magic + partial header, for the mipmap check
+                    f.seek(0)
+                
+                    # Test if the DDS file is readable - PIL decodes from the same handle
+                    with Image.open(f) as img:
+                        img_rgba = img.convert('RGBA')
+                use_alpha = self.has_alpha(img_rgba)
+            except Exception as e:
+                self.log_message(f"  ⚠️ Could not read with PIL ({e}), proceeding anyway...")
+                use_alpha = False
+        
+            has_mips = _header_has_mipmaps(dds_head)
+        
+            self.log_message(f"  Alpha: {'Yes' if use_alpha else 'No'}")
+            self.log_message(f"  Mipmaps: {'Yes' if has_mips else 'No'}")
+        
+            # Set format based on alpha: BC3 (DXT5) or BC1 (DXT1)
+            texconv_format = 'BC3_UNORM' if use_alpha else 'BC1_UNORM'
+            # Set mipmap options: full mip chain or keep single mip level only
+            mip_levels = '0' if has_mips else '1'
+            return texconv_format, mip_levels
+
+    def fix_dds_formats_with_texconv(self, input_paths, texconv_path, chunk_size=100):
+        """Fix many DDS files with one texconv run per chunk of files needing the same flags.
+        
+        Returns {input_path: fixed temp path}; files missing from it can be fixed one by one.
+        """
+        # Group files by the texconv flags they need, the alpha checks decode in parallel
+        groups = {}
+        for input_path, options in zip(input_paths, self._pool.map(self._texconv_options, input_paths)):
+            groups.setdefault(options, []).append(input_path)
+        
+        # Spread each group over the workers, at most chunk_size files per command line.
+        # texconv names its outputs after the inputs, so same-named files go to separate runs
+        chunks = []
+        for (texconv_format, mip_levels), group in groups.items():
+            for batch in _split_by_name(group):
+                size = min(chunk_size, -(-len(batch) // _MAX_WORKERS))
+                for i in range(0, len(batch), size):
+                    chunks.append((texconv_path, texconv_format, mip_levels, batch[i:i + size]))
+        
+        fixed_paths = {}
+        for chunk_fixed in self._pool.map(lambda chunk: self._run_texconv_chunk(*chunk), chunks):
+            fixed_paths.update(chunk_fixed)
+            
+        return fixed_paths
+    
+    def _run_texconv_chunk(self, texconv_path, texconv_format, mip_levels, input_paths):
+        """Run texconv once for several files - returns {input_path: fixed temp path} for those it wrote.
+        
+        The input file names must be distinct, see _split_by_name.
+        """
+        fixed_paths = {}
+        out_dir = tempfile.mkdtemp(prefix='fixed_')
+        try:
+            cmd = [texconv_path, '-f', texconv_format, '-m', mip_levels, '-y', '-o', out_dir] + input_paths
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode != 0:
+                self.log_message(f"  ⚠️ texconv batch failed: {result.stderr.strip() if result.stderr else 'Unknown error'}")
+            
+            # Collect whatever texconv wrote, even after a failure part way through
+            for input_path in input_paths:
+                texconv_output = os.path.join(out_dir, os.path.basename(input_path))
+                if os.path.exists(texconv_output):
+                    temp_fd, temp_fixed_path = tempfile.mkstemp(suffix='_fixed.dds', prefix='fixed_')
+                    self.temp_files.append(temp_fixed_path)
+                    os.close(temp_fd)
+                    os.replace(texconv_output, temp_fixed_path)
+                    fixed_paths[input_path] = temp_fixed_path
+                    
+        except Exception as e:
+            self.log_message(f"  ⚠️ texconv batch failed: {str(e)}")
+        finally:
+            shutil.rmtree(out_dir, ignore_errors=True)
+            
+        return fixed_paths
+
+    def fix_dds_format_with_texconv(self, input_path, texconv_path):
+        """Fix DDS format using texconv tool"""
+        try:
+            texconv_format, mip_levels = self._texconv_options(input_path)
+            
+            # Create temp file for fixed DDS
+            temp_fd, temp_fixed_path = tempfile.mkstemp(suffix='_fixed.dds', prefix='fixed_')
+            self.temp_files.append(temp_fixed_path)
+            os.close(temp_fd)  # Close the file descriptor, we just need the path
+            
+            # Build texconv command
+            cmd = [texconv_path, '-f', texconv_format, '-m', mip_levels]
+            
+            # Force overwrite and output to temp file
+            cmd.extend(['-y', '-o', os.path.dirname(temp_fixed_path)])
+            cmd.append(input_path)
+            
+            # Run texconv
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            
+            if result.returncode == 0:
+                # Find the output file (texconv uses original filename)
+                original_name = os.path.basename(input_path)
+                texconv_output = os.path.join(os.path.dirname(temp_fixed_path), original_name)
+                
+                if os.path.exists(texconv_output):
+                    # Move to our temp file location
+                    os.replace(texconv_output, temp_fixed_path)
+                    self.log_message(f"  ✅ DDS format fixed successfully")
+                    return temp_fixed_path
+                else:
+                    self.log_message(f"  ❌ texconv output not found")
+                    return None
+            else:
+                self.log_message(f"  ❌ texconv failed: {result.stderr.strip() if result.stderr else 'Unknown error'}")
+                return None
+                
+        except Exception as e:
+            self.log_message(f"❌ Error fixing DDS format: {str(e)}")
+            return None
+
+    def fix_dds_format_fallback(self, input_path):
+        """Fallback DDS format fixing without external tools"""
+        try:
+            # Create temp file for fixed DDS
+            temp_fd, temp_fixed_path = tempfile.mkstemp(suffix='_fixed.dds', prefix='fixed_')
+            self.temp_files.append(temp_fixed_path)
+            os.close(temp_fd)
+            
+            # Load and convert image
+            with Image.open(input_path) as img:
+                img_rgba = img.convert('RGBA')
+            
+            use_alpha = self.has_alpha(img_rgba)
+            
+            self.log_message(f"🔧 Fixing DDS format: {os.path.basename(input_path)} (fallback mode)")
+            self.log_message(f"  Alpha: {'Yes' if use_alpha else 'No'}")
+            self.log_message(f"  ⚠️ Using basic conversion (limited format support)")
+            
+            # Convert to RGB if no alpha - every pixel is opaque, so dropping the band is exact
+            if not use_alpha:
+                img_rgba = img_rgba.convert('RGB')
+            
+            # Save as DDS
+            img_rgba.save(temp_fixed_path, format='DDS')
+            
+            self.log_message(f"  ✅ DDS format fixed (basic)")
+            return temp_fixed_path
+            
+        except Exception as e:
+            self.log_message(f"❌ Error fixing DDS format: {str(e)}")
+            return None
+
+    # Include all the conversion methods from the original code
+    def detect_file_type(self, filepath, st=None):
+        """Detect if file is XBT or DDS based on header.
+        
+        st is an os.stat() result for filepath, if the caller already has one.
+        """
+        try:
+            # A file that hasn't changed since it was last looked at keeps its type
+            if st is None:
+                st = os.stat(filepath)
+            cache_key = (filepath, st.st_mtime_ns, st.st_size)
+            with self._type_cache_lock:
+                file_type = self._type_cache.get(cache_key)
+                if file_type is not None:
+                    self._type_cache.move_to_end(cache_key)  # LRU, like the header cache
+            if file_type is not None:
+                return file_type
+            
+            # Raw descriptor - no buffered file object is worth setting up for 4 bytes
+            fd = os.open(filepath, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+            try:
+                header = os.read(fd, 4)
+            finally:
+                os.close(fd)
+                
+            file_type = _FILE_TYPES.get(header, 'unknown')
+            if len(header) == 4:  # Don't remember files that may still be being written
+                with self._type_cache_lock:
+                    self._type_cache[cache_key] = file_type
+                    if len(self._type_cache) > _TYPE_CACHE_SIZE:
+                        self._type_cache.popitem(last=False)
+            return file_type
+        except Exception as e:
+            self.log_message(f"❌ Error detecting file type: {str(e)}")
+            return 'unknown'
+
+    def parse_xbt_header(self, data):
+        """Parse XBT header and return header size, DDS start position, and header data"""
+        try:
+            if len(data) < 16:
+                raise ValueError("File too small to be valid XBT")
+                
+            if not data.startswith(b'TBX\x00'):
+                raise ValueError("Invalid XBT signature")
+                
+            # Read header size from offset 0x08
+            header_size = _U32.unpack_from(data, 8)[0]
+            
+            # Find DDS signature
+            dds_start = data.find(b'DDS ', 0, _XBT_HEADER_LIMIT)
+            if dds_start == -1:
+                raise ValueError(f"No DDS data found in the first {_XBT_HEADER_LIMIT // 1024} KiB of XBT file")
+                
+            self.log_message(f"📊 XBT header size: {header_size} bytes")
+            self.log_message(f"📊 DDS data starts at offset: {dds_start}")
+            
+            return header_size, dds_start, data[:dds_start]
+            
+        except Exception as e:
+            raise ValueError(f"Error parsing XBT header: {str(e)}")
+
+    def save_header_to_xml(self, header_data, xml_path):
+        """Save XBT header data to XML file for later reconstruction"""
+        try:
+            # Create XML structure
+            root = ET.Element("XBTHeader")
+            
+            # Add metadata
+            metadata = ET.SubElement(root, "Metadata")
+            ET.SubElement(metadata, "HeaderSize").text = str(len(header_data))
+            ET.SubElement(metadata, "CreatedBy").text = "XBT-DDS Converter"
+            
+            # Parse and store header components
+            if len(header_data) >= 16:
+                # XBT signature (should be TBX\x00), unknown bytes at 0x04,
+                # header size at 0x08 and unknown bytes at 0x0C
+                signature, unknown1, stored_header_size, unknown2 = _XBT_HEAD.unpack_from(header_data)
+                ET.SubElement(metadata, "Signature").text = signature.hex()
+                ET.SubElement(metadata, "Unknown1").text = str(unknown1)
+                ET.SubElement(metadata, "StoredHeaderSize").text = str(stored_header_size)
+                ET.SubElement(metadata, "Unknown2").text = str(unknown2)
+                
+                # Hash/checksum bytes at 0x10-0x1B (if present) - hex of a view, no slice copy
+                if len(header_data) >= 28:
+                    ET.SubElement(metadata, "HashBytes").text = memoryview(header_data)[16:28].hex()
+                
+                # Check for embedded path (everything after the fixed header until null terminator)
+                if len(header_data) > 28:
+                    # Look for null terminator, searching in place rather than in a copied tail
+                    null_pos = header_data.find(b'\x00', 28)
+                    if null_pos > 28:
+                        try:
+                            embedded_path = header_data[28:null_pos].decode('ascii', errors='ignore')
+                            if embedded_path.strip():  # Only add if not empty
+                                ET.SubElement(metadata, "EmbeddedPath").text = embedded_path
+                                self.log_message(f"📁 Found embedded path: {embedded_path}")
+                        except:
+                            pass  # Skip if decoding fails
+            
+            # Store raw header data as base64 (older files used hex, see load_header_from_xml)
+            raw_data = ET.SubElement(root, "RawHeaderData", encoding="base64")
+            raw_data.text = base64.b64encode(header_data).decode('ascii')
+            
+            # Write formatted XML (indented in place, serialized straight to the file)
+            ET.indent(root, space="  ")
+            ET.ElementTree(root).write(xml_path, encoding='utf-8', xml_declaration=True)
+                
+            self.log_message(f"💾 Header saved to XML: {os.path.basename(xml_path)}")
+            return True
+            
+        except Exception as e:
+            self.log_message(f"❌ Error saving header to XML: {str(e)}")
+            return False
+
+    def load_header_from_xml(self, xml_path):
+        """Load XBT header data from XML file"""
+        try:
+            try:
+                st = os.stat(xml_path)
+            except FileNotFoundError:
+                raise ValueError(f"XML header file not found: {xml_path}")
+            
+            # Skip the parse if this XML was already decoded and hasn't changed since
+            cache_key = (xml_path, st.st_mtime_ns, st.st_size)
+            with self._header_cache_lock:
+                header_data = self._header_cache.get(cache_key)
+                if header_data is not None:
+                    self._header_cache.move_to_end(cache_key)
+            if header_data is not None:
+                self.log_message(f"📂 Header loaded from XML: {os.path.basename(xml_path)} (cached)")
+                return header_data
+                
+            # The sidecar XML is a few small elements, a plain parse is all it needs
+            root = ET.parse(xml_path).getroot()
+            
+            if root.tag != "XBTHeader":
+                raise ValueError("Invalid XML header file format")
+                
+            raw_data_elem = root.find("RawHeaderData")
+            metadata = root.find("Metadata")
+                
+            # Get raw header data
+            if raw_data_elem is None or not raw_data_elem.text:
+                raise ValueError("No raw header data found in XML")
+                
+            if raw_data_elem.get("encoding") == "base64":
+                header_data = base64.b64decode(raw_data_elem.text)
+            else:
+                # XML written by earlier versions stores the header as hex
+                header_data = bytes.fromhex(raw_data_elem.text.strip())
+            
+            # Log some metadata for verification
+            if metadata is not None:
+                header_size = metadata.find("HeaderSize")
+                if header_size is not None:
+                    self.log_message(f"📊 Loaded header size: {header_size.text} bytes")
+                    
+                embedded_path = metadata.find("EmbeddedPath")
+                if embedded_path is not None and embedded_path.text:
+                    self.log_message(f"📁 Embedded path: {embedded_path.text}")
+            
+            with self._header_cache_lock:
+                self._header_cache[cache_key] = header_data
+                if len(self._header_cache) > _HEADER_CACHE_SIZE:
+                    self._header_cache.popitem(last=False)
+            
+            self.log_message(f"📂 Header loaded from XML: {os.path.basename(xml_path)}")
+            return header_data
+            
+        except Exception as e:
+            self.log_message(f"❌ Error loading header from XML: {str(e)}")
+            return None
+
+    def xbt_to_dds(self, input_path, output_path):
+        """Convert XBT file to DDS by removing the header and saving it to XML"""
+        # Header XML goes next to the DDS; the payload is streamed rather than read into memory
+        xml_path = os.path.splitext(output_path)[0] + ".xml"
+        return self.xbt_to_dds_batch(input_path, output_path, xml_path)
+
+    def dds_to_xbt(self, input_path, output_path, fix_format=False, overwrite=True, fixed_dds_path=None):
+        """Convert DDS file to XBT by adding the original header from XML.
+        
+        With overwrite=False raises FileExistsError if the XBT output already exists.
+        fixed_dds_path is a DDS already fixed by a batch texconv run, used instead of fixing here.
+        """
+        try:
+            actual_dds_path = input_path
+            
+            if fixed_dds_path:
+                actual_dds_path = fixed_dds_path
+                self.log_message(f"✅ Using fixed DDS file for conversion")
+            
+            # Check if DDS format fixing is enabled
+            elif fix_format:
+                self.log_message(f"🔧 DDS format fixing enabled")
+                
+                # Find texconv tool
+                texconv_path = self._get_texconv()
+                if texconv_path:
+                    self.log_message(f"📦 Using texconv: {texconv_path}")
+                    fixed_dds_path = self.fix_dds_format_with_texconv(input_path, texconv_path)
+                else:
+                    self.log_message(f"📦 texconv not found, using fallback mode")
+                    fixed_dds_path = self.fix_dds_format_fallback(input_path)
+                
+                if fixed_dds_path:
+                    actual_dds_path = fixed_dds_path
+                    self.log_message(f"✅ Using fixed DDS file for conversion")
+                else:
+                    self.log_message(f"⚠️ DDS fixing failed, using original file")
+            
+            # Stream the DDS file (original or fixed) behind the header, without reading it into memory
+            with _bopen(actual_dds_path, 'rb') as src:
+                magic = src.read(4)
+                if magic != b'DDS ':
+                    raise ValueError("Invalid DDS file - missing DDS signature")
+                    
+                # Look for corresponding XML header file
+                base_name = os.path.splitext(input_path)[0]  # Use original path for XML lookup
+                xml_path = base_name + ".xml"
+                
+                # Load header from XML
+                header_data = self.load_header_from_xml(xml_path)
+                if not header_data:
+                    raise ValueError(f"Failed to load header from XML file: {xml_path}")
+                    
+                # Combine header and DDS data - a failed copy leaves no partial XBT behind
+                with _replace_on_success(output_path, overwrite) as out:
+                    _preallocate(out, len(header_data) + os.fstat(src.fileno()).st_size)
+                    out.write(header_data)
+                    out.write(magic)
+                    shutil.copyfileobj(src, out, length=1 << 20)
+                    out.truncate()  # In case the input shrank while copying
+                    total_size = out.tell()
+                
+            self.log_message(f"✅ Successfully converted DDS to XBT")
+            self.log_message(f"📂 Used header from: {os.path.basename(xml_path)}")
+            self.log_message(f"📊 Added {len(header_data)} bytes XBT header")
+            self.log_message(f"📊 Total XBT file size: {total_size} bytes")
+            
+            return True
+            
+        except FileExistsError:
+            raise
+        except Exception as e:
+            self.log_message(f"❌ Error converting DDS to XBT: {str(e)}")
+            return False
+
+    def check_conversion_requirements(self, input_path, conversion_type):
+        """Check if all required files exist for conversion"""
+        if conversion_type == "dds_to_xbt":
+            # For DDS to XBT, we need the corresponding XML file
+            base_name = os.path.splitext(input_path)[0]
+            xml_path = base_name + ".xml"
+            if not os.path.exists(xml_path):
+                return False, f"Required XML header file not found: {os.path.basename(xml_path)}"
+        return True, ""
+
+    def convert_single_file(self, input_path, conversion_type="auto", fix_format=False):
+        """Convert a single file"""
+        try:
+            # Reject empty or truncated files before doing any codec work -
+            # the same stat is reused for type detection
+            st = os.stat(input_path)
+            if st.st_size < _MIN_INPUT_BYTES:
+                raise ValueError(f"File too small to be XBT or DDS ({st.st_size} bytes)")
+                
+            # Determine conversion direction
+            if conversion_type == "auto":
+                file_type = self.detect_file_type(input_path, st)
+                if file_type == 'xbt':
+                    conversion_type = "xbt_to_dds"
+                elif file_type == 'dds':
+                    conversion_type = "dds_to_xbt"
+                else:
+                    raise ValueError("Unable to detect file type. Please specify conversion direction manually.")
+                    
+            self.log_message(f"🚀 Starting conversion: {conversion_type}")
+            self.log_message(f"📂 Input file: {input_path}")
+            
+            # Generate output filename
+            base_name = os.path.splitext(input_path)[0]
+            
+            if conversion_type == "xbt_to_dds":
+                output_path = base_name + ".dds"
+                success = self.xbt_to_dds(input_path, output_path)
+            else:  # dds_to_xbt
+                output_path = base_name + ".xbt"
+                success = self.dds_to_xbt(input_path, output_path, fix_format=fix_format)
+                
+            if success:
+                self.log_message(f"💾 Output file: {output_path}")
+                
+            return success
+            
+        except Exception as e:
+            self.log_message(f"❌ Single file conversion error: {str(e)}")
+            return False
+
+class XBTDDSConverter(XBTDDSEngine):
+    def __init__(self, root):
+        super().__init__()
+        self.root = root
+        self.root.title("XBT ↔ DDS Converter | Made By: Jasper_Zebra | Version 1.0")
+        self.root.geometry("1600x1000")
+        self.root.resizable(False, False)
+        self.root.configure(bg='#2c2c2c')
+        
+        # Canvas text fonts, resolved once instead of parsing a font spec per item
+        self._fonts = {
+            'title': tkfont.Font(family='Segoe UI', size=32, weight='bold'),
+            'subtitle': tkfont.Font(family='Segoe UI', size=14),
+            'heading': tkfont.Font(family='Segoe UI', size=14, weight='bold'),
+            'stats': tkfont.Font(family='Segoe UI', size=12),
+            'placeholder': tkfont.Font(family='Segoe UI', size=20),
+            'body': tkfont.Font(family='Segoe UI', size=10),
+            'small': tkfont.Font(family='Segoe UI', size=9)
+        }
+        
+        # Initialize variables
+        self.conversion_mode = tk.StringVar(value="single")
+        self.conversion_type = tk.StringVar(value="auto")
+        self.file_path = tk.StringVar()
+        self.include_subdirs = tk.BooleanVar(value=True)
+        self.overwrite_existing = tk.BooleanVar(value=False)
+        self.fix_dds_format = tk.BooleanVar(value=False)  # ADD THIS LINE
+        self.archive_originals = tk.BooleanVar(value=False)
+        self.background_image = None
+        self.window_icon = None  # Add this to store icon reference
+        self._log_queue = collections.deque()  # Pending log messages, may come from worker threads
+        self._last_ui_ts = 0.0  # Last progress window redraw, for throttling
+        self._last_progress_pct = -1  # Percentage shown by the last redraw
+        self._preview_cache = collections.OrderedDict()  # (path, mtime, size) -> (info, photo, header text)
+        self._preview_temp_path = None  # Reused temp DDS for previews, removed on exit
+        self._ui_calls = queue.Queue()  # Tk calls made by the conversion worker, see _ui_thread
+        self._worker = None  # Thread running the current conversion
+        self._converting = False  # Set from convert_file until _finish_conversion, inputs are locked meanwhile
+        
+        # Set up logging
+        logging.basicConfig(level=logging.DEBUG)
+        
+        # Set up window icon
+        self._setup_window_icon()
+
+        # Setup the modern interface
+        self._setup_background_image()
+        self.setup_modern_ui()
+        
+        # Bind file path changes to preview updates
+        self.file_path.trace('w', self.update_preview)       
+        
+        # Start writing queued log messages, at most every _LOG_FLUSH_MS
+        self._flush_log()
+
+    def _setup_window_icon(self):
+        """Set up the window icon"""
+        try:
+            icon_set = False
+            
+            # Try different possible icon locations
+            for icon_path in _existing_icon_paths():
+                try:
+                    if icon_path.lower().endswith('.ico'):
+                        # Use ICO file directly
+                        self.root.iconbitmap(icon_path)
+                        self.logger.debug(f"Set ICO icon: {icon_path}")
+                        icon_set = True
+                        break
+                    elif icon_path.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp')):
+                        # Convert image (already resized to icon size) to PhotoImage and use as icon
+                        icon_photo = ImageTk.PhotoImage(_load_icon_image(icon_path))
+                        
+                        # Set the icon
+                        self.root.iconphoto(True, icon_photo)
+                        
+                        # Keep a reference to prevent garbage collection
+                        self.window_icon = icon_photo
+                        
+                        self.logger.debug(f"Set PNG icon: {icon_path}")
+                        icon_set = True
+                        break
+                        
+                except Exception as e:
+                    self.logger.warning(f"Failed to load icon {icon_path}: {str(e)}")
+                    continue
+            
+            if not icon_set:
+                self.logger.info("No icon file found, using default system icon")
+                
+            return icon_set
+            
+        except Exception as e:
+            self.logger.error(f"Error setting up window icon: {str(e)}")
+            return False
+
+    def _setup_background_image(self):
+        """Load and set up the background image"""
+        try:
+            # You can use the same background or create a similar one
+            pil_image = _load_background((1600, 1000))
+            
+            if pil_image is not None:
+                self.background_image = ImageTk.PhotoImage(pil_image)
+                
+                self.canvas = tk.Canvas(self.root, width=1400, height=900, highlightthickness=0)
+                self.canvas.pack(fill=tk.BOTH, expand=True)
+                self.canvas.create_image(0, 0, anchor=tk.NW, image=self.background_image)
+                
+                self.logger.debug(f"Background image loaded successfully")
+                return True
+            else:
+                self.logger.warning(f"Background image not found, using solid background")
+                self.canvas = tk.Canvas(self.root, width=1400, height=900, bg='#2c2c2c', highlightthickness=0)
+                self.canvas.pack(fill=tk.BOTH, expand=True)
+                return False
+                
+        except Exception as e:
+            self.logger.error(f"Failed to load background image: {str(e)}")
+            self.canvas = tk.Canvas(self.root, width=1400, height=900, bg='#2c2c2c', highlightthickness=0)
+            self.canvas.pack(fill=tk.BOTH, expand=True)
+            return False
+
+    def create_preview_image(self, dds_data, max_size=360):
+        """Create a preview image from DDS data"""
         try:
-            with open(input_path, 'rb') as f:
-                data = f.read()
-                
-            header_size, dds_start, header_data = self.parse_xbt_header(data)
+            # For now, we'll create a placeholder that shows the texture exists
+            # and basic info. Full DDS decoding would require more complex logic
+            # or external libraries like DirectXTex
             
-            # Save header to XML file in output directory
-            if not self.save_header_to_xml(header_data, xml_output_path):
-                raise ValueError("Failed to save header to XML")
+            info, error = self.parse_dds_header(dds_data)
+            if error:
+                return None, error
             
-            # Extract DDS data (everything after DDS signature)
-            dds_data = data[dds_start:]
+            # Create a placeholder image with texture info
+            preview_img = Image.new('RGB', (max_size, max_size), color='#404040')
             
-            # Write DDS file to output directory
-            with open(output_path, 'wb') as f:
-                f.write(dds_data)
-                
-            self.log_message(f"✅ Successfully converted XBT to DDS")
-            self.log_message(f"📊 Removed {dds_start} bytes of XBT header")
-            self.log_message(f"📊 DDS file size: {len(dds_data)} bytes")
-            self.log_message(f"💾 Header saved as: {os.path.basename(xml_output_path)}")
+            # Try to extract some pixel data for a simple preview
+            # This is a very basic approach - real DDS decoding is much more complex
+            try:
+                # Skip DDS header (128 bytes) and try to interpret raw pixel data
+                pixel_data_start = 128
+                if len(dds_data) > pixel_data_start + 1024:  # Ensure we have some data
+                    # Create a simple pattern from the raw data
+                    # Only the length is needed here, the pixels are read through a NumPy view
+                    raw_len = min(max_size * max_size * 3, len(dds_data) - pixel_data_start)
+                    
+                    # Create a simple visualization
+                    if raw_len > 0:
+                        # Scale the raw data to create a pattern
+                        pattern_size = min(64, int(raw_len ** 0.5))
+                        if pattern_size > 0:
+                            pattern_img = _pattern_image(dds_data, pixel_data_start, pattern_size, 100)
+
+                            # Scale up the pattern to preview size
+                            preview_img = pattern_img.resize((max_size, max_size), Image.NEAREST)
+            except:
+                # If pixel extraction fails, create a info display
+                pass
             
-            return True
+            return preview_img, None
             
         except Exception as e:
-            self.log_message(f"❌ Error converting XBT to DDS: {str(e)}")
-            return False
+            return None, f"Error creating preview: {str(e)}"
 
+    @_ui_thread
     def show_search_progress_window(self):
         """Show a custom loading window for file searching"""
         # Create the progress window
@@ -533,23 +1502,22 @@ class XBTDDSConverter:
         self.search_total_count.pack(anchor=tk.W, pady=1)
         
         # Force window to appear
-        self.search_window.update()
+        self.search_window.update_idletasks()
 
-    def update_search_progress(self, current_dir, xbt_count, dds_count, progress_percent=0):
+    @_ui_thread
+    def update_search_progress(self, current_dir, xbt_count, dds_count, dirs_scanned=0):
         """Update the search progress window"""
         if hasattr(self, 'search_window') and self.search_window.winfo_exists():
-            # Update status with percentage
+            # Update status with the number of folders scanned so far
             dir_name = os.path.basename(current_dir) if current_dir else "..."
-            self.search_status_label.config(text=f"Scanning: {dir_name} ({progress_percent}%)")
+            self.search_status_label.config(text=f"Scanning: {dir_name} ({dirs_scanned} folders)")
             
             # Update counts
             self.search_xbt_count.config(text=f"📦 XBT Files: {xbt_count}")
             self.search_dds_count.config(text=f"🖼️ DDS Files: {dds_count}")
             self.search_total_count.config(text=f"📋 Total Files: {xbt_count + dds_count}")
-            
-            # Update window
-            self.search_window.update()
 
+    @_ui_thread
     def close_search_progress_window(self):
         """Close the search progress window"""
         if hasattr(self, 'search_window') and self.search_window.winfo_exists():
@@ -557,6 +1525,7 @@ class XBTDDSConverter:
             self.search_window.grab_release()
             self.search_window.destroy()
 
+    @_ui_thread
     def show_copy_progress_window(self, total_files):
         """Show a custom loading window for file copying"""
         self.copy_window = tk.Toplevel(self.root)
@@ -593,23 +1562,42 @@ class XBTDDSConverter:
                                         font=('Segoe UI', 10, 'bold'), fg='#ffaa66', bg='#2c2c2c')
         self.copy_progress_label.pack(pady=1)
         
-        self.copy_window.update()
+        self.copy_window.update_idletasks()
 
+    @_ui_thread
     def update_copy_progress(self, current_file, completed, total):
-        """Update the copy progress window"""
+        """Update the copy progress window - throttled, see _progress_due"""
+        if not self._progress_due(completed, total):
+            return
+        
         if hasattr(self, 'copy_window') and self.copy_window.winfo_exists():
             progress_percent = int((completed / total) * 100)
             self.copy_progress_bar.config(value=completed)
             self.copy_status_label.config(text=f"Copying: {os.path.basename(current_file)}")
             self.copy_progress_label.config(text=f"{progress_percent}% ({completed}/{total})")
-            self.copy_window.update()
 
+    def _progress_due(self, completed, total):
+        """Allow a progress redraw at most 10 times per second, and only when the percentage changed"""
+        if completed != total:
+            now = time.monotonic()
+            percent = completed * 100 // total
+            if percent == self._last_progress_pct or now - self._last_ui_ts < 0.1:
+                return False
+            self._last_ui_ts = now
+            self._last_progress_pct = percent
+        return True
+        
+    @_ui_thread
     def close_copy_progress_window(self):
-        """Close the copy progress window"""
+        """Close the copy progress window after a short pause to show the final state"""
+        self.root.after(300, self._destroy_copy_progress_window)
+        
+    def _destroy_copy_progress_window(self):
         if hasattr(self, 'copy_window') and self.copy_window.winfo_exists():
             self.copy_window.grab_release()
             self.copy_window.destroy()
 
+    @_ui_thread
     def show_convert_progress_window(self, total_files):
         """Show a custom loading window for file conversion"""
         self.convert_window = tk.Toplevel(self.root)
@@ -646,107 +1634,156 @@ class XBTDDSConverter:
                                             font=('Segoe UI', 10, 'bold'), fg='#ffaa66', bg='#2c2c2c')
         self.convert_progress_label.pack(pady=1)
         
-        self.convert_window.update()
+        # The main window bar follows the file count too, instead of just animating
+        self.progress.stop()
+        self.progress.config(mode='determinate', maximum=total_files, value=0)
+        
+        self.convert_window.update_idletasks()
 
+    @_ui_thread
     def update_convert_progress(self, current_file, completed, total):
-        """Update the convert progress window"""
+        """Update the convert progress window - throttled, see _progress_due"""
+        if not self._progress_due(completed, total):
+            return
+        
         if hasattr(self, 'convert_window') and self.convert_window.winfo_exists():
             progress_percent = int((completed / total) * 100)
             self.convert_progress_bar.config(value=completed)
+            self.progress.config(value=completed)
             self.convert_status_label.config(text=f"Converting: {os.path.basename(current_file)}")
             self.convert_progress_label.config(text=f"{progress_percent}% ({completed}/{total})")
-            self.convert_window.update()
 
+    @_ui_thread
     def close_convert_progress_window(self):
-        """Close the convert progress window"""
+        """Close the convert progress window after a short pause to show the final state"""
+        self.root.after(300, self._destroy_convert_progress_window)
+        
+    def _destroy_convert_progress_window(self):
         if hasattr(self, 'convert_window') and self.convert_window.winfo_exists():
             self.convert_window.grab_release()
             self.convert_window.destroy()
 
-    def find_files_in_folder_with_progress(self, folder_path, extensions):
-        """Find all files with given extensions in folder with progress display"""
-        files = []
-        xbt_count = 0
-        dds_count = 0
+    def find_files_in_folder_with_progress(self, folder_path, extensions, recursive=True):
+        """Find all files with given extensions in folder with progress display.
+        
+        The walk runs on a worker thread while this one keeps the window responsive.
+        Returns (sorted files, XBT count, DDS count).
+        """
+        if threading.current_thread() is not threading.main_thread():
+            # Called by the conversion worker - walk right here, the window calls are queued
+            self.show_search_progress_window()
+            try:
+                files, xbt_count, dds_count, dirs_scanned = self._scan_reporting(
+                    folder_path, _ext_tuple(extensions), recursive, self.update_search_progress)
+            except Exception:
+                self.close_search_progress_window()
+                raise
+            self._finish_search_progress(xbt_count, dds_count, dirs_scanned)
+            return files, xbt_count, dds_count
+        
+        # Show progress window - the bar stays indeterminate, so the tree is only walked once
+        self.show_search_progress_window()
         
-        # First pass: count total directories to scan
-        total_dirs = sum(1 for root, dirs, files in os.walk(folder_path))
+        updates = queue.Queue()
+        done = tk.BooleanVar(value=False)
+        result = {}
         
-        # Show progress window
-        self.show_search_progress_window()
+        def drain():
+            # Show only the latest progress, the worker may be far ahead of the redraws
+            progress = None
+            while True:
+                try:
+                    kind, *payload = updates.get_nowait()
+                except queue.Empty:
+                    break
+                if kind == 'progress':
+                    progress = payload
+                else:
+                    result[kind] = payload
+                    
+            if progress:
+                self.update_search_progress(*progress)
+            if result:
+                done.set(True)
+            else:
+                self.root.after(100, drain)
         
-        # Configure progress bar for determinate mode
-        self.search_progress_bar.config(mode='determinate', maximum=total_dirs, value=0)
+        threading.Thread(target=self._scan_worker,
+                         args=(folder_path, _ext_tuple(extensions), recursive, updates),
+                         daemon=True).start()
+        self.root.after(100, drain)
+        self.root.wait_variable(done)  # Runs the event loop until drain() sees the result
         
-        try:
-            # Walk through directories with progress tracking
-            for dir_index, (root, dirs, filenames) in enumerate(os.walk(folder_path)):
-                # Update progress with current directory and percentage
-                progress_percent = int((dir_index / total_dirs) * 100)
-                self.search_progress_bar.config(value=dir_index)
-                self.update_search_progress(root, xbt_count, dds_count, progress_percent)
-                
-                # Process files in current directory
-                for filename in filenames:
-                    if any(filename.lower().endswith(ext.lower()) for ext in extensions):
-                        filepath = os.path.join(root, filename)
-                        files.append(filepath)
-                        
-                        # Update counts
-                        if filename.lower().endswith('.xbt'):
-                            xbt_count += 1
-                        elif filename.lower().endswith('.dds'):
-                            dds_count += 1
-            
-            # Final update at 100%
-            self.search_progress_bar.config(value=total_dirs)
-            self.update_search_progress("Search Complete!", xbt_count, dds_count, 100)
-            
-            # Brief pause to show final counts
-            self.root.after(100, self.close_search_progress_window)
-            
-        except Exception as e:
+        if 'error' in result:
             self.close_search_progress_window()
-            raise e
+            raise result['error'][0]
         
-        return sorted(files)
-
-    def find_files_in_folder(self, folder_path, extensions):
-        """Find all files with given extensions in folder - always search recursively for batch mode"""
-        files = []
+        files, xbt_count, dds_count, dirs_scanned = result['done']
+        self._finish_search_progress(xbt_count, dds_count, dirs_scanned)
         
-        # Always search recursively for batch mode to find all XBT files in subdirectories
-        for root, dirs, filenames in os.walk(folder_path):
-            for filename in filenames:
-                if any(filename.lower().endswith(ext.lower()) for ext in extensions):
-                    files.append(os.path.join(root, filename))
-                    
-        return sorted(files)
+        return files, xbt_count, dds_count
+    
+    @_ui_thread
+    def _finish_search_progress(self, xbt_count, dds_count, dirs_scanned):
+        """Show the final counts with the bar full, then close the search window"""
+        if not (hasattr(self, 'search_window') and self.search_window.winfo_exists()):
+            return  # Closed by the user during the scan
+        self.search_progress_bar.stop()
+        self.search_progress_bar.config(mode='determinate', maximum=1, value=1)
+        self.update_search_progress("Search Complete!", xbt_count, dds_count, dirs_scanned)
+        
+        # Brief pause to show final counts
+        self.root.after(100, self.close_search_progress_window)
+    
+    def _scan_worker(self, folder_path, exts, recursive, updates):
+        """Walk folder_path on a worker thread, reporting through the updates queue (no Tk calls here)"""
+        try:
+            result = self._scan_reporting(folder_path, exts, recursive,
+                                          lambda *progress: updates.put(('progress', *progress)))
+            updates.put(('done', *result))
+        except Exception as e:
+            updates.put(('error', e))
+    
+    def _scan_reporting(self, folder_path, exts, recursive, report):
+        """_scan_files calling report(current_dir, xbt_count, dds_count, dirs_scanned) at most 10 times per second.
+        
+        Returns (sorted files, XBT count, DDS count, folders scanned).
+        """
+        dirs_scanned = 0
+        last_report = 0.0
+        
+        def on_dir(current_dir, xbt_count, dds_count):
+            nonlocal dirs_scanned, last_report
+            dirs_scanned += 1
+            now = time.monotonic()
+            if now - last_report >= 0.1:
+                last_report = now
+                report(current_dir, xbt_count, dds_count, dirs_scanned)
+        
+        files, xbt_count, dds_count = _scan_files(folder_path, exts, on_dir, recursive)
+        return files, xbt_count, dds_count, dirs_scanned
 
     def update_preview(self, *args):
         """Update the preview window when a file is selected"""
+        if self._converting:
+            return  # The running conversion still uses the temp files and the log cleared below
+            
         filepath = self.file_path.get()
         
         # Clean up previous temp files
         self.cleanup_temp_files()
 
         # Clear the conversion log when loading a new file
-        self.log_text.delete(1.0, tk.END)
+        self.clear_log()
 
         self.fix_dds_format = tk.BooleanVar(value=False)
         
-        # Clear previous preview
-        self.preview_canvas.delete("all")
+        # Clear previous preview - the canvas items are reused, just hidden
+        self._show_preview_items()
         
         if not filepath or not os.path.exists(filepath):
             # Show placeholder
-            self.preview_canvas.create_text(
-                175, 175,  # Updated center position
-                text="🖼️\nSelect a file to preview", 
-                font=('Segoe UI', 10), 
-                fill='#666666', 
-                justify=tk.CENTER
-            )
+            self._show_preview_message("🖼️\nSelect a file to preview", fill='#666666')
             
             # Reset info labels
             self.preview_info['filename'].config(text="No file selected")
@@ -771,48 +1808,25 @@ class XBTDDSConverter:
                     extensions = ['.dds']
                 
                 # Use the progress version for batch mode
-                files = self.find_files_in_folder_with_progress(filepath, extensions)
-                xbt_files = [f for f in files if f.lower().endswith('.xbt')]
-                dds_files = [f for f in files if f.lower().endswith('.dds')]
+                files, xbt_count, dds_count = self.find_files_in_folder_with_progress(
+                    filepath, extensions, recursive=self.include_subdirs.get())
                 
                 # Show file count in preview area
-                self.preview_canvas.create_text(
-                    225, 150,
-                    text="📁 Batch Mode Selected",
-                    font=('Segoe UI', 14, 'bold'),
-                    fill='#2a7fff',
-                    justify=tk.CENTER
-                )
-                
-                self.preview_canvas.create_text(
-                    225, 200,
-                    text=f"📊 Files Found:\n📦 XBT Files: {len(xbt_files)}\n🖼️ DDS Files: {len(dds_files)}\n📋 Total: {len(files)}",
-                    font=('Segoe UI', 12),
-                    fill='#cccccc',
-                    justify=tk.CENTER
-                )
-                
                 if len(files) > 0:
-                    self.preview_canvas.create_text(
-                        225, 280,
-                        text="✅ Ready to convert!\nClick 'Convert Folder' to begin.",
-                        font=('Segoe UI', 10),
-                        fill='#66ff66',
-                        justify=tk.CENTER
-                    )
+                    status = dict(text="✅ Ready to convert!\nClick 'Convert Folder' to begin.", fill='#66ff66')
                 else:
-                    self.preview_canvas.create_text(
-                        225, 280,
-                        text="⚠️ No compatible files found\nin selected folder or subfolders.",
-                        font=('Segoe UI', 10),
-                        fill='#ffaa66',
-                        justify=tk.CENTER
-                    )
+                    status = dict(text="⚠️ No compatible files found\nin selected folder or subfolders.", fill='#ffaa66')
+                    
+                self._show_preview_items(
+                    header=dict(text="📁 Batch Mode Selected"),
+                    stats=dict(text=f"📊 Files Found:\n📦 XBT Files: {xbt_count}\n🖼️ DDS Files: {dds_count}\n📋 Total: {len(files)}"),
+                    status=status
+                )
                 
                 # Update info labels for batch mode
                 folder_name = os.path.basename(filepath)
                 self.preview_info['filename'].config(text=f"Folder: {folder_name}")
-                self.preview_info['format'].config(text=f"Files: {len(xbt_files)} XBT, {len(dds_files)} DDS")
+                self.preview_info['format'].config(text=f"Files: {xbt_count} XBT, {dds_count} DDS")
                 self.preview_info['dimensions'].config(text="Mode: Batch Processing")
                 self.preview_info['size'].config(text=f"Total Files: {len(files)}")
                 self.preview_info['compression'].config(text="Conversion: Multiple Files")
@@ -821,8 +1835,8 @@ class XBTDDSConverter:
                 # Log the file count information
                 self.log_message(f"📁 Batch folder selected: {folder_name}")
                 self.log_message(f"📊 Found {len(files)} total files:")
-                self.log_message(f"   📦 XBT files: {len(xbt_files)}")
-                self.log_message(f"   🖼️ DDS files: {len(dds_files)}")
+                self.log_message(f"   📦 XBT files: {xbt_count}")
+                self.log_message(f"   🖼️ DDS files: {dds_count}")
                 if len(files) > 0:
                     self.log_message(f"✅ Ready for batch conversion!")
                 else:
@@ -832,155 +1846,121 @@ class XBTDDSConverter:
                 
             except Exception as e:
                 self.close_search_progress_window()  # Make sure to close progress window on error
-                self.preview_canvas.create_text(
-                    225, 225,
-                    text=f"❌ Error scanning folder:\n{str(e)}",
-                    font=('Segoe UI', 10),
-                    fill='#ff6666',
-                    justify=tk.CENTER
-                )
+                self._show_preview_message(f"❌ Error scanning folder:\n{str(e)}", 225, 225, fill='#ff6666')
                 return
         
         # Single file mode - continue with normal preview (only for single files)
         try:
-            # Extract DDS data and create temp file
-            temp_dds_path = self.create_temp_dds(filepath)
-            if not temp_dds_path:
-                self.preview_canvas.create_text(
-                    175, 175, 
-                    text="❌\nCannot extract DDS data", 
-                    font=('Segoe UI', 10), 
-                    fill='#ff6666', 
-                    justify=tk.CENTER
-                )
-                return
-            
-            # Parse DDS header from temp file
-            dds_info, error = self.parse_dds_header_from_file(temp_dds_path)
-            if error:
-                self.preview_canvas.create_text(
-                    175, 175, 
-                    text=f"❌\nError parsing DDS: {error}", 
-                    font=('Segoe UI', 10), 
-                    fill='#ff6666', 
-                    justify=tk.CENTER
-                )
-                return
+            # Reuse the parsed header and preview image if this exact file was shown recently
+            st = os.stat(filepath)
+            # Absolute path, so the same file typed or picked differently still hits
+            cache_key = (os.path.abspath(filepath), st.st_mtime_ns, st.st_size)
+            cached = self._preview_cache.get(cache_key)
+            
+            if cached is not None:
+                self._preview_cache.move_to_end(cache_key)
+                dds_info, preview_photo, header_text = cached
+            else:
+                # Extract DDS data and create temp file
+                temp_dds_path = self.create_temp_dds(filepath)
+                if not temp_dds_path:
+                    self._show_preview_message("❌\nCannot extract DDS data", fill='#ff6666')
+                    return
+                
+                # Parse DDS header from temp file
+                dds_info, error = self.parse_dds_header_from_file(temp_dds_path)
+                if error:
+                    self._show_preview_message(f"❌\nError parsing DDS: {error}", fill='#ff6666')
+                    return
+                
+                # Determine header size
+                if filepath.lower().endswith('.xbt'):
+                    with open(filepath, 'rb') as f:
+                        dds_start = _read_xbt_prefix(f).find(b'DDS ')
+                    header_size = dds_start if dds_start != -1 else 0
+                    header_text = f"Header Size: {header_size} bytes (XBT)"
+                else:
+                    header_text = "Header Size: 128 bytes (DDS)"
+                
+                # PIL might not support DDS directly, so we may get a pattern preview or nothing
+                try:
+                    preview_img = self.create_preview_from_temp_dds(temp_dds_path, dds_info)
+                    preview_photo = ImageTk.PhotoImage(preview_img) if preview_img else None
+                except Exception:
+                    preview_photo = None
+                
+                self._preview_cache[cache_key] = (dds_info, preview_photo, header_text)
+                if len(self._preview_cache) > _PREVIEW_CACHE_SIZE:
+                    self._preview_cache.popitem(last=False)
             
             # Update info labels
             filename = os.path.basename(filepath)
-            file_size = os.path.getsize(filepath)
             
             self.preview_info['filename'].config(text=filename)
             self.preview_info['format'].config(text=f"Format: {dds_info['format']}")
             self.preview_info['dimensions'].config(text=f"Dimensions: {dds_info['width']} × {dds_info['height']}")
-            self.preview_info['size'].config(text=f"File Size: {file_size:,} bytes")
+            self.preview_info['size'].config(text=f"File Size: {st.st_size:,} bytes")
             self.preview_info['compression'].config(text=f"Compression: {dds_info['format']}")
+            self.preview_info['header_size'].config(text=header_text)
             
-            # Determine header size
-            if filepath.lower().endswith('.xbt'):
-                with open(filepath, 'rb') as f:
-                    data = f.read()
-                    dds_start = data.find(b'DDS ')
-                header_size = dds_start if dds_start != -1 else 0
-                self.preview_info['header_size'].config(text=f"Header Size: {header_size} bytes (XBT)")
-            else:
-                self.preview_info['header_size'].config(text="Header Size: 128 bytes (DDS)")
-            
-            # Try to load the DDS file with PIL
-            try:
-                # PIL might not support DDS directly, so we'll show a pattern preview
-                preview_img = self.create_preview_from_temp_dds(temp_dds_path, dds_info)
+            if preview_photo:
+                # Keep a reference, Tk doesn't
+                self.preview_photo = preview_photo
                 
-                if preview_img:
-                    # Convert to PhotoImage and display
-                    self.preview_photo = ImageTk.PhotoImage(preview_img)
-                    
-                    # Center the image in the canvas - UPDATED FOR LARGER CANVAS
-                    canvas_width = 450
-                    canvas_height = 450
-                    img_x = (canvas_width - preview_img.width) // 4
-                    img_y = (canvas_height - preview_img.height) // 4
-                    
-                    self.preview_canvas.create_image(
-                        img_x, img_y, 
-                        anchor=tk.NW, 
-                        image=self.preview_photo
-                    )
-                    
+                # Center the image in the canvas - UPDATED FOR LARGER CANVAS
+                canvas_width = canvas_height = _PREVIEW_CANVAS_SIZE
+                img_width = preview_photo.width()
+                img_height = preview_photo.height()
+                img_x = (canvas_width - img_width) // 4
+                img_y = (canvas_height - img_height) // 4
+                
+                self._show_preview_items(
+                    image=dict(coords=(img_x, img_y), image=self.preview_photo),
                     # Add a border around the image
-                    self.preview_canvas.create_rectangle(
-                        img_x - 1, img_y - 1, 
-                        img_x + preview_img.width + 1, img_y + preview_img.height + 1,
-                        outline='#666666', 
-                        width=1
-                    )
-                    
+                    border=dict(coords=(img_x - 1, img_y - 1, img_x + img_width + 1, img_y + img_height + 1)),
                     # Add info overlay at bottom
-                    self.preview_canvas.create_text(
-                        canvas_width // 2, canvas_height - 20,
-                        text=f"{dds_info['width']} × {dds_info['height']} • {dds_info['format']}",
-                        font=('Segoe UI', 9),
-                        fill='#cccccc',
-                        justify=tk.CENTER
-                    )
-                else:
-                    # Show info without image
-                    self.preview_canvas.create_text(
-                        175, 175, 
-                        text=f"📊\nDDS Info Preview\n{dds_info['width']} × {dds_info['height']}\n{dds_info['format']}", 
-                        font=('Segoe UI', 10), 
-                        fill='#cccccc', 
-                        justify=tk.CENTER
+                    overlay=dict(
+                        coords=(canvas_width // 2, canvas_height - 20),
+                        text=f"{dds_info['width']} × {dds_info['height']} • {dds_info['format']}"
                     )
-            
-            except Exception as e:
-                # Show info without image preview
-                self.preview_canvas.create_text(
-                    175, 175, 
-                    text=f"📊\nDDS Info Available\n{dds_info['width']} × {dds_info['height']}\n{dds_info['format']}", 
-                    font=('Segoe UI', 10), 
-                    fill='#cccccc', 
-                    justify=tk.CENTER
                 )
+            else:
+                # Show info without image
+                self._show_preview_message(f"📊\nDDS Info Preview\n{dds_info['width']} × {dds_info['height']}\n{dds_info['format']}")
                 
         except Exception as e:
-            self.preview_canvas.create_text(
-                175, 175, 
-                text=f"❌\nPreview Error:\n{str(e)}", 
-                font=('Segoe UI', 10), 
-                fill='#ff6666', 
-                justify=tk.CENTER
-            )
+            self._show_preview_message(f"❌\nPreview Error:\n{str(e)}", fill='#ff6666')
 
     def create_temp_dds(self, filepath):
         """Create a temporary DDS file from XBT or DDS file"""
         try:
             with open(filepath, 'rb') as f:
-                data = f.read()
-            
-            # Check if it's an XBT file
-            if data[:4] == b'TBX\x00':
-                # Find DDS signature in XBT file
-                dds_start = data.find(b'DDS ')
-                if dds_start == -1:
+                # Locate the DDS signature in the first few KiB, then copy only the DDS part
+                head = _read_xbt_prefix(f)
+                
+                # Check if it's an XBT file
+                if head.startswith(b'TBX\x00'):
+                    # Find DDS signature in XBT file
+                    dds_start = head.find(b'DDS ')
+                    if dds_start == -1:
+                        return None
+                elif head.startswith(b'DDS '):
+                    # Already a DDS file
+                    dds_start = 0
+                else:
                     return None
-                dds_data = data[dds_start:]
-            elif data[:4] == b'DDS ':
-                # Already a DDS file
-                dds_data = data
-            else:
-                return None
-            
-            # Create temporary file
-            temp_fd, temp_path = tempfile.mkstemp(suffix='.dds', prefix='preview_')
-            self.temp_files.append(temp_path)
-            
-            # Write DDS data to temp file
-            with os.fdopen(temp_fd, 'wb') as temp_file:
-                temp_file.write(dds_data)
+                
+                # Create the temporary file once per session, later previews overwrite it
+                if self._preview_temp_path is None:
+                    temp_fd, self._preview_temp_path = tempfile.mkstemp(suffix='.dds', prefix='preview_')
+                    os.close(temp_fd)
+                
+                # Stream DDS data to temp file in chunks, never holding the whole texture
+                f.seek(dds_start)
+                with open(self._preview_temp_path, 'wb') as temp_file:
+                    shutil.copyfileobj(f, temp_file, length=1 << 20)
             
-            return temp_path
+            return self._preview_temp_path
             
         except Exception as e:
             self.log_message(f"❌ Error creating temp DDS: {str(e)}")
@@ -1020,21 +2000,8 @@ class XBTDDSConverter:
                 # Create a simple pattern visualization
                 pattern_size = min(128, int(len(pixel_data) ** 0.5))  # Increased from 64 to 128
                 if pattern_size > 8:
-                    pattern_img = Image.new('RGB', (pattern_size, pattern_size))
-                    pixels = []
-                    
-                    for i in range(0, min(len(pixel_data), pattern_size * pattern_size * 3), 3):
-                        if i + 2 < len(pixel_data):
-                            r = pixel_data[i] if i < len(pixel_data) else 128
-                            g = pixel_data[i + 1] if i + 1 < len(pixel_data) else 128
-                            b = pixel_data[i + 2] if i + 2 < len(pixel_data) else 128
-                            pixels.append((r, g, b))
-                    
-                    # Fill remaining pixels
-                    while len(pixels) < pattern_size * pattern_size:
-                        pixels.append((128, 128, 128))
-                    
-                    pattern_img.putdata(pixels[:pattern_size * pattern_size])
+                    # Whole RGB triples, remaining pixels filled with grey
+                    pattern_img = _pattern_image(pixel_data, 0, pattern_size, 128)
                     
                     # Scale up to preview size maintaining aspect ratio
                     preview_img = pattern_img.resize((max_size, max_size), Image.NEAREST)
@@ -1046,20 +2013,15 @@ class XBTDDSConverter:
             self.log_message(f"❌ Error creating preview: {str(e)}")
             return None
 
-    def cleanup_temp_files(self):
-        """Clean up temporary files"""
-        for temp_path in self.temp_files:
-            try:
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
-            except Exception as e:
-                self.log_message(f"⚠️ Could not delete temp file: {str(e)}")
-        
-        self.temp_files.clear()
-
     def on_closing(self):
         """Handle application closing"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
         self.cleanup_temp_files()
+        if self._preview_temp_path:
+            try:
+                os.unlink(self._preview_temp_path)
+            except OSError:
+                pass
         self.root.destroy()
 
     def setup_modern_ui(self):
@@ -1073,14 +2035,14 @@ class XBTDDSConverter:
         self._create_preview_section()
         self._create_log_section()
         self._create_footer_section()
-        
+
     def _create_header_section(self):
         """Create the modern header section"""
         # Main title
         self.canvas.create_text(
             80, 20,
             text="🔄 XBT ↔ DDS Converter | Version 1.0",
-            font=('Segoe UI', 32, 'bold'),
+            font=self._fonts['title'],
             fill='white',
             anchor=tk.NW
         )
@@ -1089,7 +2051,7 @@ class XBTDDSConverter:
         self.canvas.create_text(
             80, 90,
             text="Advanced Texture Converter - Complete Header Preservation",
-            font=('Segoe UI', 14),
+            font=self._fonts['subtitle'],
             fill='#dddddd',
             anchor=tk.NW
         )
@@ -1098,11 +2060,11 @@ class XBTDDSConverter:
         self.canvas.create_text(
             80, 115,
             text="Modern Edition | Perfect Round-trip Conversion",
-            font=('Segoe UI', 10),
+            font=self._fonts['body'],
             fill='#bbbbbb',
             anchor=tk.NW
         )
-        
+
     def _create_mode_selection_cards(self):
         """Create modern mode selection cards"""
         # Section title
@@ -1137,7 +2099,7 @@ class XBTDDSConverter:
         self.mode_cards = {}
         for mode in modes:
             self._create_mode_card(mode)
-            
+
     def _create_mode_card(self, mode):
         """Create a mode selection card"""
         x = mode["x"]
@@ -1213,6 +2175,8 @@ class XBTDDSConverter:
         
         # Bind click events
         def on_click(event, mode_id=mode['id']):
+            if self._converting:
+                return
             self.conversion_mode.set(mode_id)
             self._update_mode_selection(mode_id)
             self.on_mode_change()
@@ -1230,7 +2194,7 @@ class XBTDDSConverter:
         
         self.canvas.tag_bind(f"mode_card_{mode['id']}", "<Enter>", on_enter)
         self.canvas.tag_bind(f"mode_card_{mode['id']}", "<Leave>", on_leave)
-        
+
     def _update_mode_selection(self, selected_mode):
         """Update visual selection of mode cards"""
         for mode_id, card_data in self.mode_cards.items():
@@ -1244,139 +2208,6 @@ class XBTDDSConverter:
                 self.canvas.itemconfig(card_data['card'], fill='#4B4B4B', outline='#404040', width=1)
                 self.canvas.itemconfig(card_data['indicator'], fill='#404040', outline='#666666')
                 card_data['selected'] = False
-                
-    def has_alpha(self, image):
-        """Check if image has meaningful alpha data"""
-        if image.mode != 'RGBA':
-            return False
-        alpha = np.array(image.split()[-1])
-        return not np.all(alpha == 255)
-
-    def has_mipmaps(self, filepath):
-        """Check if DDS file has mipmaps"""
-        try:
-            with open(filepath, 'rb') as f:
-                f.read(4)  # Skip magic
-                header = f.read(28)  # Read partial header
-                flags = struct.unpack('<I', header[4:8])[0]
-                mip_count = struct.unpack('<I', header[24:28])[0]
-                return bool(flags & 0x20000) and mip_count > 1
-        except:
-            return False
-
-    def find_texconv(self):
-        """Find texconv.exe tool"""
-        # Check current directory first
-        local_texconv = os.path.join(os.path.dirname(__file__), 'texconv.exe')
-        if os.path.exists(local_texconv):
-            return local_texconv
-        
-        # Check PATH
-        try:
-            subprocess.run(['texconv'], capture_output=True, check=False)
-            return 'texconv'
-        except FileNotFoundError:
-            return None
-
-    def fix_dds_format_with_texconv(self, input_path, texconv_path):
-        """Fix DDS format using texconv tool"""
-        try:
-            # Test if the DDS file is readable
-            try:
-                with Image.open(input_path) as img:
-                    img_rgba = img.convert('RGBA')
-                use_alpha = self.has_alpha(img_rgba)
-            except Exception as e:
-                self.log_message(f"  ⚠️ Could not read with PIL ({e}), proceeding anyway...")
-                use_alpha = False
-            
-            has_mips = self.has_mipmaps(input_path)
-            
-            self.log_message(f"🔧 Fixing DDS format: {os.path.basename(input_path)}")
-            self.log_message(f"  Alpha: {'Yes' if use_alpha else 'No'}")
-            self.log_message(f"  Mipmaps: {'Yes' if has_mips else 'No'}")
-            
-            # Create temp file for fixed DDS
-            temp_fd, temp_fixed_path = tempfile.mkstemp(suffix='_fixed.dds', prefix='fixed_')
-            self.temp_files.append(temp_fixed_path)
-            os.close(temp_fd)  # Close the file descriptor, we just need the path
-            
-            # Build texconv command
-            cmd = [texconv_path]
-            
-            # Set format based on alpha
-            if use_alpha:
-                cmd.extend(['-f', 'BC3_UNORM'])  # DXT5
-            else:
-                cmd.extend(['-f', 'BC1_UNORM'])  # DXT1
-            
-            # Set mipmap options
-            if has_mips:
-                cmd.extend(['-m', '0'])  # Generate full mip chain
-            else:
-                cmd.extend(['-m', '1'])  # Keep single mip level only
-            
-            # Force overwrite and output to temp file
-            cmd.extend(['-y', '-o', os.path.dirname(temp_fixed_path)])
-            cmd.append(input_path)
-            
-            # Run texconv
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                # Find the output file (texconv uses original filename)
-                original_name = os.path.basename(input_path)
-                texconv_output = os.path.join(os.path.dirname(temp_fixed_path), original_name)
-                
-                if os.path.exists(texconv_output):
-                    # Move to our temp file location
-                    os.replace(texconv_output, temp_fixed_path)
-                    self.log_message(f"  ✅ DDS format fixed successfully")
-                    return temp_fixed_path
-                else:
-                    self.log_message(f"  ❌ texconv output not found")
-                    return None
-            else:
-                self.log_message(f"  ❌ texconv failed: {result.stderr.strip() if result.stderr else 'Unknown error'}")
-                return None
-                
-        except Exception as e:
-            self.log_message(f"❌ Error fixing DDS format: {str(e)}")
-            return None
-
-    def fix_dds_format_fallback(self, input_path):
-        """Fallback DDS format fixing without external tools"""
-        try:
-            # Create temp file for fixed DDS
-            temp_fd, temp_fixed_path = tempfile.mkstemp(suffix='_fixed.dds', prefix='fixed_')
-            self.temp_files.append(temp_fixed_path)
-            os.close(temp_fd)
-            
-            # Load and convert image
-            with Image.open(input_path) as img:
-                img_rgba = img.convert('RGBA')
-            
-            use_alpha = self.has_alpha(img_rgba)
-            
-            self.log_message(f"🔧 Fixing DDS format: {os.path.basename(input_path)} (fallback mode)")
-            self.log_message(f"  Alpha: {'Yes' if use_alpha else 'No'}")
-            self.log_message(f"  ⚠️ Using basic conversion (limited format support)")
-            
-            # Convert to RGB if no alpha
-            if not use_alpha:
-                rgb_img = Image.new('RGB', img_rgba.size, (255, 255, 255))
-                rgb_img.paste(img_rgba, mask=img_rgba.split()[-1])
-                img_rgba = rgb_img
-            
-            # Save as DDS
-            img_rgba.save(temp_fixed_path, format='DDS')
-            
-            self.log_message(f"  ✅ DDS format fixed (basic)")
-            return temp_fixed_path
-            
-        except Exception as e:
-            self.log_message(f"❌ Error fixing DDS format: {str(e)}")
-            return None
 
     def _create_file_selection_section(self):
         """Create modern file selection section"""
@@ -1399,14 +2230,15 @@ class XBTDDSConverter:
         
         self.file_entry = tk.Entry(path_frame, textvariable=self.file_path, 
                                   font=('Segoe UI', 10), bg='#2c2c2c', fg='white',
-                                  insertbackground='white', relief='solid', bd=1)
+                                  insertbackground='white', relief='solid', bd=1,
+                                  readonlybackground='#2c2c2c')
         self.file_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(10, 10))
         
         self.browse_btn = tk.Button(path_frame, text="Browse File", 
                                    font=('Segoe UI', 10, 'bold'), bg='#2a7fff', fg='white',
                                    relief='flat', padx=20, command=self.browse_file)
         self.browse_btn.pack(side=tk.RIGHT)
-        
+
     def _create_conversion_options(self):
         """Create modern conversion options section"""
         # Main options frame
@@ -1472,6 +2304,10 @@ class XBTDDSConverter:
                     font=('Segoe UI', 9), fg='white', bg='#3a3a3a', selectcolor='#3a3a3a',
                     activebackground='#3a3a3a', activeforeground='white').pack(side=tk.LEFT, padx=(20, 0))
         
+        tk.Checkbutton(batch_options_frame, text="📦 Archive original XBT files", variable=self.archive_originals,
+                    font=('Segoe UI', 9), fg='white', bg='#3a3a3a', selectcolor='#3a3a3a',
+                    activebackground='#3a3a3a', activeforeground='white').pack(side=tk.LEFT, padx=(20, 0))
+
     def _create_action_section(self):
         """Create modern action section with convert button"""
         # Convert button
@@ -1480,7 +2316,7 @@ class XBTDDSConverter:
                                     relief='flat', padx=40, pady=15, command=self.convert_file,
                                     state='disabled')
         self.convert_btn_window = self.canvas.create_window(80, 730, anchor=tk.NW, window=self.convert_btn)
-        
+
     def _create_progress_section(self):
         """Create modern progress section"""
         # Progress frame
@@ -1495,7 +2331,7 @@ class XBTDDSConverter:
         self.progress_label = tk.Label(progress_frame, text="", font=('Segoe UI', 9), 
                                       fg='#dddddd', bg='#3a3a3a')
         self.progress_label.pack(padx=15, pady=(0, 10))
-        
+
     def _create_preview_section(self):
         """Create modern DDS/XBT preview section"""
         # Preview frame
@@ -1512,7 +2348,7 @@ class XBTDDSConverter:
         preview_content_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 15))
         
         # Create preview canvas for image display - INCREASED SIZE
-        self.preview_canvas = tk.Canvas(preview_content_frame, width=450, height=450, 
+        self.preview_canvas = tk.Canvas(preview_content_frame, width=_PREVIEW_CANVAS_SIZE, height=_PREVIEW_CANVAS_SIZE, 
                                     bg='#2c2c2c', relief='solid', bd=1,
                                     highlightthickness=0)
         self.preview_canvas.pack(side=tk.LEFT, padx=(0, 15), pady=5)
@@ -1544,9 +2380,46 @@ class XBTDDSConverter:
         
         # Preview placeholder
         self.preview_image = None
-        self.preview_canvas.create_text(230, 230, text="🖼️\nSelect a file to preview", 
-                                    font=('Segoe UI', 20), fill='#666666', justify=tk.CENTER)
         
+        # Preview canvas items are created once, update_preview reconfigures and shows/hides them
+        canvas = self.preview_canvas
+        self._preview_items = {
+            'message': canvas.create_text(230, 230, text="🖼️\nSelect a file to preview", 
+                                          font=self._fonts['placeholder'], fill='#666666', justify=tk.CENTER,
+                                          tags="preview_message"),
+            'header': canvas.create_text(225, 150, font=self._fonts['heading'], fill='#2a7fff',
+                                         justify=tk.CENTER, state=tk.HIDDEN, tags="preview_header"),
+            'stats': canvas.create_text(225, 200, font=self._fonts['stats'], fill='#cccccc',
+                                        justify=tk.CENTER, state=tk.HIDDEN, tags="preview_stats"),
+            'status': canvas.create_text(225, 280, font=self._fonts['body'],
+                                         justify=tk.CENTER, state=tk.HIDDEN, tags="preview_status"),
+            'image': canvas.create_image(0, 0, anchor=tk.NW, state=tk.HIDDEN, tags="preview_image"),
+            'border': canvas.create_rectangle(0, 0, 0, 0, outline='#666666', width=1,
+                                              state=tk.HIDDEN, tags="preview_border"),
+            'overlay': canvas.create_text(225, 430, font=self._fonts['small'], fill='#cccccc',
+                                          justify=tk.CENTER, state=tk.HIDDEN, tags="preview_overlay")
+        }
+
+    def _show_preview_items(self, **options):
+        """Show the named preview canvas items with the given options and hide all others.
+        
+        An optional 'coords' entry moves the item before it is shown.
+        """
+        for name, item in self._preview_items.items():
+            item_options = options.get(name)
+            if item_options is None:
+                self.preview_canvas.itemconfigure(item, state=tk.HIDDEN)
+                continue
+            
+            coords = item_options.pop('coords', None)
+            if coords:
+                self.preview_canvas.coords(item, *coords)
+            self.preview_canvas.itemconfigure(item, state=tk.NORMAL, **item_options)
+            
+    def _show_preview_message(self, text, x=175, y=175, fill='#cccccc'):
+        """Show a single centered message in the preview canvas"""
+        self._show_preview_items(message=dict(coords=(x, y), text=text, font=self._fonts['body'], fill=fill))
+
     def _create_log_section(self):
         """Create modern log section - smaller version"""
         # Log frame - reduced height from 440 to 200
@@ -1571,7 +2444,7 @@ class XBTDDSConverter:
         
         self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
+
     def _create_footer_section(self):
         """Create modern footer section"""
         # Separator line
@@ -1627,6 +2500,7 @@ class XBTDDSConverter:
         
         # Bind click event to open URL
         def open_avatar_link(event):
+            import webbrowser
             webbrowser.open("https://github.com/JasperZebra/AVATAR-Save-Editor/releases")
         
         self.canvas.tag_bind("avatar_link", "<Button-1>", open_avatar_link)
@@ -1661,19 +2535,56 @@ class XBTDDSConverter:
             anchor=tk.NW
         )
 
+    @_ui_thread
     def update_status(self, message):
-        """Update the status text"""
+        """Update the status text - redrawn by the event loop, conversions run off the UI thread"""
         self.canvas.itemconfig(self.status_text, text=message)
-        self.root.update_idletasks()
-        
-    def log_message(self, message):
-        """Add a message to the log text area"""
-        self.log_text.insert(tk.END, message + "\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
-        
+
+    def _write_log(self, message):
+        """Queue a message for the log text area - safe to call from worker threads"""
+        self._log_queue.append(message)
+
+    def _flush_log(self):
+        """Write queued log messages with a single insert, then reschedule (UI thread only)"""
+        # popleft rather than copy-and-clear, so messages appended meanwhile aren't lost
+        log_queue = self._log_queue
+        messages = [log_queue.popleft() for _ in range(len(log_queue))]
+            
+        if messages:
+            self.log_text.insert(tk.END, "\n".join(messages) + "\n")
+            self.log_text.see(tk.END)
+            
+        self.root.after(_LOG_FLUSH_MS, self._flush_log)
+
+    def _run_ui_calls(self):
+        """Run the Tk calls queued by the conversion worker, rescheduling while it runs (UI thread only)"""
+        # Checked before draining, so calls queued just before the worker exits still run
+        worker_alive = self._worker is not None and self._worker.is_alive()
+        while True:
+            try:
+                method, args, kwargs = self._ui_calls.get_nowait()
+            except queue.Empty:
+                break
+            # One failing call mustn't drop the rest - the queued _finish_conversion unlocks the inputs
+            try:
+                method(self, *args, **kwargs)
+            except Exception as e:
+                self.logger.exception("UI call %s failed", method.__name__)
+                self.log_message(f"❌ UI update error: {str(e)}")
+            
+        if worker_alive:
+            self.root.after(50, self._run_ui_calls)
+
+    def clear_log(self):
+        """Clear the log text area, including messages not written yet"""
+        self._log_queue.clear()
+        self.log_text.delete(1.0, tk.END)
+
     def on_mode_change(self):
         """Handle conversion mode change"""
+        if self._converting:
+            return
+            
         mode = self.conversion_mode.get()
         
         if mode == "single":
@@ -1692,9 +2603,12 @@ class XBTDDSConverter:
         self.convert_btn.config(state='disabled')
         self.progress_label.config(text="")
         self.update_status("Ready - Select a file/folder to begin")
-        
+
     def browse_file(self):
         """Open file dialog to select input file"""
+        if self._converting:
+            return
+            
         filetypes = [
             ("All supported", "*.xbt;*.dds"),
             ("XBT files", "*.xbt"),
@@ -1712,9 +2626,12 @@ class XBTDDSConverter:
             self.convert_btn.config(state='normal')
             self.log_message(f"✅ Selected file: {os.path.basename(filename)}")
             self.update_status(f"File selected: {os.path.basename(filename)}")
-            
+
     def browse_folder(self):
         """Open folder dialog to select input folder"""
+        if self._converting:
+            return
+            
         folder_path = filedialog.askdirectory(
             title="Select folder containing XBT or DDS files"
         )
@@ -1724,254 +2641,12 @@ class XBTDDSConverter:
             self.convert_btn.config(state='normal')
             self.log_message(f"✅ Selected folder: {folder_path}")
             self.update_status(f"Folder selected: {os.path.basename(folder_path)}")
-            
-    # Include all the conversion methods from the original code
-    def detect_file_type(self, filepath):
-        """Detect if file is XBT or DDS based on header"""
-        try:
-            with open(filepath, 'rb') as f:
-                header = f.read(4)
-                if header == b'TBX\x00':
-                    return 'xbt'
-                elif header == b'DDS ':
-                    return 'dds'
-                else:
-                    return 'unknown'
-        except Exception as e:
-            self.log_message(f"❌ Error detecting file type: {str(e)}")
-            return 'unknown'
-            
-    def parse_xbt_header(self, data):
-        """Parse XBT header and return header size, DDS start position, and header data"""
-        try:
-            if len(data) < 16:
-                raise ValueError("File too small to be valid XBT")
-                
-            if data[:4] != b'TBX\x00':
-                raise ValueError("Invalid XBT signature")
-                
-            # Read header size from offset 0x08
-            header_size = struct.unpack('<I', data[8:12])[0]
-            
-            # Find DDS signature
-            dds_start = data.find(b'DDS ')
-            if dds_start == -1:
-                raise ValueError("No DDS data found in XBT file")
-                
-            self.log_message(f"📊 XBT header size: {header_size} bytes")
-            self.log_message(f"📊 DDS data starts at offset: {dds_start}")
-            
-            return header_size, dds_start, data[:dds_start]
-            
-        except Exception as e:
-            raise ValueError(f"Error parsing XBT header: {str(e)}")
-            
-    def save_header_to_xml(self, header_data, xml_path):
-        """Save XBT header data to XML file for later reconstruction"""
-        try:
-            # Create XML structure
-            root = ET.Element("XBTHeader")
-            
-            # Add metadata
-            metadata = ET.SubElement(root, "Metadata")
-            ET.SubElement(metadata, "HeaderSize").text = str(len(header_data))
-            ET.SubElement(metadata, "CreatedBy").text = "XBT-DDS Converter"
-            
-            # Parse and store header components
-            if len(header_data) >= 16:
-                # XBT signature (should be TBX\x00)
-                signature = header_data[:4]
-                ET.SubElement(metadata, "Signature").text = signature.hex()
-                
-                # Unknown bytes at 0x04
-                unknown1 = struct.unpack('<I', header_data[4:8])[0]
-                ET.SubElement(metadata, "Unknown1").text = str(unknown1)
-                
-                # Header size at 0x08
-                stored_header_size = struct.unpack('<I', header_data[8:12])[0]
-                ET.SubElement(metadata, "StoredHeaderSize").text = str(stored_header_size)
-                
-                # Unknown bytes at 0x0C
-                unknown2 = struct.unpack('<I', header_data[12:16])[0]
-                ET.SubElement(metadata, "Unknown2").text = str(unknown2)
-                
-                # Hash/checksum bytes at 0x10-0x1B (if present)
-                if len(header_data) >= 28:
-                    hash_bytes = header_data[16:28]
-                    ET.SubElement(metadata, "HashBytes").text = hash_bytes.hex()
-                
-                # Check for embedded path (everything after the fixed header until null terminator)
-                if len(header_data) > 28:
-                    path_data = header_data[28:]
-                    # Look for null terminator
-                    null_pos = path_data.find(b'\x00')
-                    if null_pos > 0:
-                        try:
-                            embedded_path = path_data[:null_pos].decode('ascii', errors='ignore')
-                            if embedded_path.strip():  # Only add if not empty
-                                ET.SubElement(metadata, "EmbeddedPath").text = embedded_path
-                                self.log_message(f"📁 Found embedded path: {embedded_path}")
-                        except:
-                            pass  # Skip if decoding fails
-            
-            # Store raw header data as hex
-            raw_data = ET.SubElement(root, "RawHeaderData")
-            raw_data.text = header_data.hex()
-            
-            # Write formatted XML
-            xml_str = ET.tostring(root, encoding='unicode')
-            dom = minidom.parseString(xml_str)
-            pretty_xml = dom.toprettyxml(indent="  ")
-            
-            with open(xml_path, 'w', encoding='utf-8') as f:
-                f.write(pretty_xml)
-                
-            self.log_message(f"💾 Header saved to XML: {os.path.basename(xml_path)}")
-            return True
-            
-        except Exception as e:
-            self.log_message(f"❌ Error saving header to XML: {str(e)}")
-            return False
-            
-    def load_header_from_xml(self, xml_path):
-        """Load XBT header data from XML file"""
-        try:
-            if not os.path.exists(xml_path):
-                raise ValueError(f"XML header file not found: {xml_path}")
-                
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
-            
-            if root.tag != "XBTHeader":
-                raise ValueError("Invalid XML header file format")
-                
-            # Get raw header data
-            raw_data_elem = root.find("RawHeaderData")
-            if raw_data_elem is None or not raw_data_elem.text:
-                raise ValueError("No raw header data found in XML")
-                
-            header_data = bytes.fromhex(raw_data_elem.text.strip())
-            
-            # Log some metadata for verification
-            metadata = root.find("Metadata")
-            if metadata is not None:
-                header_size = metadata.find("HeaderSize")
-                if header_size is not None:
-                    self.log_message(f"📊 Loaded header size: {header_size.text} bytes")
-                    
-                embedded_path = metadata.find("EmbeddedPath")
-                if embedded_path is not None and embedded_path.text:
-                    self.log_message(f"📁 Embedded path: {embedded_path.text}")
-            
-            self.log_message(f"📂 Header loaded from XML: {os.path.basename(xml_path)}")
-            return header_data
-            
-        except Exception as e:
-            self.log_message(f"❌ Error loading header from XML: {str(e)}")
-            return None
-
-    def xbt_to_dds(self, input_path, output_path):
-        """Convert XBT file to DDS by removing the header and saving it to XML"""
-        try:
-            with open(input_path, 'rb') as f:
-                data = f.read()
-                
-            header_size, dds_start, header_data = self.parse_xbt_header(data)
-            
-            # Generate XML path for header
-            base_name = os.path.splitext(output_path)[0]
-            xml_path = base_name + ".xml"
-            
-            # Save header to XML file
-            if not self.save_header_to_xml(header_data, xml_path):
-                raise ValueError("Failed to save header to XML")
-            
-            # Extract DDS data (everything after DDS signature)
-            dds_data = data[dds_start:]
-            
-            # Write DDS file
-            with open(output_path, 'wb') as f:
-                f.write(dds_data)
-                
-            self.log_message(f"✅ Successfully converted XBT to DDS")
-            self.log_message(f"📊 Removed {dds_start} bytes of XBT header")
-            self.log_message(f"📊 DDS file size: {len(dds_data)} bytes")
-            self.log_message(f"💾 Header saved as: {os.path.basename(xml_path)}")
-            
-            return True
-            
-        except Exception as e:
-            self.log_message(f"❌ Error converting XBT to DDS: {str(e)}")
-            return False
-
-    def dds_to_xbt(self, input_path, output_path):
-        """Convert DDS file to XBT by adding the original header from XML"""
-        try:
-            actual_dds_path = input_path
-            
-            # Check if DDS format fixing is enabled
-            if self.fix_dds_format.get():
-                self.log_message(f"🔧 DDS format fixing enabled")
-                
-                # Find texconv tool
-                texconv_path = self.find_texconv()
-                if texconv_path:
-                    self.log_message(f"📦 Using texconv: {texconv_path}")
-                    fixed_dds_path = self.fix_dds_format_with_texconv(input_path, texconv_path)
-                else:
-                    self.log_message(f"📦 texconv not found, using fallback mode")
-                    fixed_dds_path = self.fix_dds_format_fallback(input_path)
-                
-                if fixed_dds_path:
-                    actual_dds_path = fixed_dds_path
-                    self.log_message(f"✅ Using fixed DDS file for conversion")
-                else:
-                    self.log_message(f"⚠️ DDS fixing failed, using original file")
-            
-            # Read DDS file (original or fixed)
-            with open(actual_dds_path, 'rb') as f:
-                dds_data = f.read()
-                
-            if not dds_data.startswith(b'DDS '):
-                raise ValueError("Invalid DDS file - missing DDS signature")
-                
-            # Look for corresponding XML header file
-            base_name = os.path.splitext(input_path)[0]  # Use original path for XML lookup
-            xml_path = base_name + ".xml"
-            
-            # Load header from XML
-            header_data = self.load_header_from_xml(xml_path)
-            if not header_data:
-                raise ValueError(f"Failed to load header from XML file: {xml_path}")
-                
-            # Combine header and DDS data
-            with open(output_path, 'wb') as f:
-                f.write(header_data)
-                f.write(dds_data)
-                
-            self.log_message(f"✅ Successfully converted DDS to XBT")
-            self.log_message(f"📂 Used header from: {os.path.basename(xml_path)}")
-            self.log_message(f"📊 Added {len(header_data)} bytes XBT header")
-            self.log_message(f"📊 Total XBT file size: {len(header_data) + len(dds_data)} bytes")
-            
-            return True
-            
-        except Exception as e:
-            self.log_message(f"❌ Error converting DDS to XBT: {str(e)}")
-            return False
-            
-    def check_conversion_requirements(self, input_path, conversion_type):
-        """Check if all required files exist for conversion"""
-        if conversion_type == "dds_to_xbt":
-            # For DDS to XBT, we need the corresponding XML file
-            base_name = os.path.splitext(input_path)[0]
-            xml_path = base_name + ".xml"
-            if not os.path.exists(xml_path):
-                return False, f"Required XML header file not found: {os.path.basename(xml_path)}"
-        return True, ""
 
     def convert_file(self):
         """Main conversion function - handles both single file and batch conversion"""
+        if self._converting:
+            return
+            
         input_path = self.file_path.get()
         
         if not input_path:
@@ -1979,89 +2654,89 @@ class XBTDDSConverter:
             return
             
         # Clear log
-        self.log_text.delete(1.0, tk.END)
+        self.clear_log()
         
-        # Start progress animation
+        # Start progress animation, and lock the inputs until _finish_conversion
+        self._converting = True
         self.progress.start(10)
         self.convert_btn.config(state='disabled')
+        self.browse_btn.config(state='disabled')
+        self.file_entry.config(state='readonly')
         self.progress_label.config(text="")
         self.update_status("Converting...")
         
+        mode = self.conversion_mode.get()
+        
         try:
-            mode = self.conversion_mode.get()
-            
+            # Options are read here, Tk variables belong to the UI thread
             if mode == "single":
                 # Single file conversion
                 if not os.path.exists(input_path):
                     raise ValueError("Selected file does not exist")
                     
-                success = self.convert_single_file(input_path)
+                convert = self.convert_single_file
+                options = dict(
+                    conversion_type=self.conversion_type.get(),
+                    fix_format=self.fix_dds_format.get()
+                )
                 
             else:
                 # Batch folder conversion
                 if not os.path.isdir(input_path):
                     raise ValueError("Selected path is not a folder")
                     
-                success = self.convert_batch(input_path)
+                convert = self.convert_batch
+                options = dict(
+                    conversion_type=self.conversion_type.get(),
+                    overwrite=self.overwrite_existing.get(),
+                    fix_format=self.fix_dds_format.get(),
+                    archive_originals=self.archive_originals.get(),
+                    include_subdirs=self.include_subdirs.get()
+                )
                 
-            if success:
-                self.update_status("✅ Conversion completed successfully!")
-                if mode == "single":
-                    messagebox.showinfo("Success", "File converted successfully!")
-                else:
-                    messagebox.showinfo("Success", "Batch conversion completed successfully!")
-            else:
-                self.update_status("❌ Conversion failed!")
-                messagebox.showerror("Error", "Conversion failed. Check the log for details.")
+            # Convert on a worker thread so the window stays responsive
+            self._worker = threading.Thread(target=self._run_conversion,
+                                            args=(mode, convert, input_path, options),
+                                            daemon=True)
+            self._worker.start()
+            self.root.after(50, self._run_ui_calls)
                 
         except Exception as e:
-            self.log_message(f"❌ Conversion error: {str(e)}")
-            self.update_status("❌ Conversion failed!")
-            messagebox.showerror("Error", f"Conversion failed: {str(e)}")
-            
-        finally:
-            # Stop progress animation and re-enable button
-            self.progress.stop()
-            self.progress.config(mode='indeterminate', value=0)
-            self.convert_btn.config(state='normal')
-            self.progress_label.config(text="")
-            
-    def convert_single_file(self, input_path):
-        """Convert a single file"""
+            self._finish_conversion(mode, False, e)
+
+    def _run_conversion(self, mode, convert, input_path, options):
+        """Run convert(input_path, **options) on the worker thread, then report back on the UI thread"""
         try:
-            # Determine conversion direction
-            conversion_type = self.conversion_type.get()
-            
-            if conversion_type == "auto":
-                file_type = self.detect_file_type(input_path)
-                if file_type == 'xbt':
-                    conversion_type = "xbt_to_dds"
-                elif file_type == 'dds':
-                    conversion_type = "dds_to_xbt"
-                else:
-                    raise ValueError("Unable to detect file type. Please specify conversion direction manually.")
-                    
-            self.log_message(f"🚀 Starting conversion: {conversion_type}")
-            self.log_message(f"📂 Input file: {input_path}")
-            
-            # Generate output filename
-            base_name = os.path.splitext(input_path)[0]
-            
-            if conversion_type == "xbt_to_dds":
-                output_path = base_name + ".dds"
-                success = self.xbt_to_dds(input_path, output_path)
-            else:  # dds_to_xbt
-                output_path = base_name + ".xbt"
-                success = self.dds_to_xbt(input_path, output_path)
-                
-            if success:
-                self.log_message(f"💾 Output file: {output_path}")
-                
-            return success
-            
+            self._finish_conversion(mode, convert(input_path, **options))
         except Exception as e:
-            self.log_message(f"❌ Single file conversion error: {str(e)}")
-            return False
+            self._finish_conversion(mode, False, e)
+
+    @_ui_thread
+    def _finish_conversion(self, mode, success, error=None):
+        """Report the conversion result and reset the progress controls"""
+        if error is not None:
+            msg = str(error)  # Formatted once for the log and the dialog
+            self.log_message(f"❌ Conversion error: {msg}")
+            self.update_status("❌ Conversion failed!")
+            messagebox.showerror("Error", f"Conversion failed: {msg}")
+        elif success:
+            self.update_status("✅ Conversion completed successfully!")
+            if mode == "single":
+                messagebox.showinfo("Success", "File converted successfully!")
+            else:
+                messagebox.showinfo("Success", "Batch conversion completed successfully!")
+        else:
+            self.update_status("❌ Conversion failed!")
+            messagebox.showerror("Error", "Conversion failed. Check the log for details.")
+            
+        # Stop progress animation and re-enable the inputs
+        self._converting = False
+        self.progress.stop()
+        self.progress.config(mode='indeterminate', value=0)
+        self.convert_btn.config(state='normal')
+        self.browse_btn.config(state='normal')
+        self.file_entry.config(state='normal')
+        self.progress_label.config(text="")
 
 def main():
     root = tk.Tk()